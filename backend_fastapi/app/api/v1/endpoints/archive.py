@@ -1,88 +1,119 @@
-from datetime import datetime, timedelta
-from pathlib import Path
-import json
-from fastapi import APIRouter, Depends, BackgroundTasks, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from app.services.scraper import ScraperService
-from app.models.archive import DayArchive
-from app.dependencies import get_scraper_service
+from app.services.rollover import RolloverScheduler
+from app.services.prefetch import PrefetchPlanner
+from app.services.articles import ArticleFetcher
+from app.models.archive import DayArchive, SectionArchive
+from app.models.article import ArticleBody
+from app.models.compact import CompactDay
+from app.dependencies import (
+    get_scraper_service,
+    get_rollover_scheduler,
+    get_prefetch_planner,
+    get_article_fetcher,
+)
 from app.core.security import validate_api_key
+from app.api.v1.endpoints.common import (
+    Projection,
+    client_key,
+    load_fallback_data,
+    validate_date,
+    validate_section,
+)
 
 router = APIRouter(prefix="/archive", tags=["archive"])
 
-def load_fallback_data() -> DayArchive:
-    fallback_path = Path("fallback_data/fallback.json")
-    
-    if not fallback_path.exists():
-        raise HTTPException(
-            status_code=503,
-            detail="No data available and fallback file not found"
-        )
-    
-    try:
-        with open(fallback_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        return DayArchive(**data)
-    except Exception as e:
-        raise HTTPException(
-            status_code=503,
-            detail=f"Failed to load fallback data: {str(e)}"
-        )
-
 @router.get("/today", response_model=DayArchive)
 async def get_today(
-    background_tasks: BackgroundTasks,
+    projection: Projection = Depends(),
     scraper: ScraperService = Depends(get_scraper_service),
+    rollover: RolloverScheduler = Depends(get_rollover_scheduler),
     _: None = Depends(validate_api_key)
 ):
     today = scraper.get_todays_date()
     
-    deleted = await scraper.repository.delete_old_files(today)
-    if deleted > 0:
-        print(f"Deleted {deleted} old files")
+    # Not fed to the prefetch planner: its baseline votes would queue
+    # yesterday on every /today call, and today is the rollover's job.
+    snapshot = rollover.get(today)
+    if snapshot:
+        if projection.is_full:
+            return Response(content=snapshot.body, media_type="application/json")
+        return projection.day(snapshot.compact)
     
-    archive = await scraper.load_archive(today)
+    compact = await scraper.load_compact(today)
     
-    if not archive:
+    if not compact:
         print(f"No data for today ({today}), loading fallback data")
         try:
-            archive = load_fallback_data()
+            compact = CompactDay.from_archive(load_fallback_data(scraper))
         except HTTPException:
             raise HTTPException(
                 status_code=404, 
                 detail=f"No data for today ({today}) and no fallback available"
             )
     
-    background_tasks.add_task(scraper.ensure_tomorrow_exists)
-    return archive
+    return projection.day(compact)
 
-@router.get("/{date}", response_model=DayArchive)
-async def get_date(
-    date: str,
-    background_tasks: BackgroundTasks,
-    scraper: ScraperService = Depends(get_scraper_service),
+# Declared before /{date}/{section}, which would otherwise match "article/{id}".
+@router.get("/article/{article_id}", response_model=ArticleBody)
+async def get_article(
+    article_id: str,
+    articles: ArticleFetcher = Depends(get_article_fetcher),
     _: None = Depends(validate_api_key)
 ):
     try:
-        datetime.strptime(date, '%Y-%m-%d')
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
+        body = await articles.get(article_id)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Scraping error: {str(e)}")
+    
+    if body is None:
+        raise HTTPException(status_code=404, detail=f"No article body for {article_id}")
+    return body
 
-    archive = await scraper.load_archive(date)
+async def load_or_scrape(
+    date: str,
+    request: Request,
+    scraper: ScraperService,
+    planner: PrefetchPlanner
+) -> CompactDay:
+    validate_date(date)
+    
+    compact = await scraper.load_compact(date)
+    planner.observe(client_key(request), date, warm=compact is not None)
     
-    if not archive:
+    if not compact:
         print(f"Data not found for {date}, scraping...")
         try:
-            archive = await scraper.scrape_day(date)
+            await scraper.scrape_day(date)
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Scraping error: {str(e)}")
+        compact = await scraper.load_compact(date)
     
-    async def precompute_next_day():
-        try:
-            next_day = (datetime.strptime(date, '%Y-%m-%d') + timedelta(days=1)).strftime('%Y-%m-%d')
-            if not await scraper.repository.file_exists(next_day):
-                await scraper.scrape_day(next_day)
-        except Exception as e:
-            print(f"Error precomputing: {e}")
-    
-    background_tasks.add_task(precompute_next_day)
-    return archive
\ No newline at end of file
+    return compact
+
+@router.get("/{date}", response_model=DayArchive)
+async def get_date(
+    date: str,
+    request: Request,
+    projection: Projection = Depends(),
+    scraper: ScraperService = Depends(get_scraper_service),
+    planner: PrefetchPlanner = Depends(get_prefetch_planner),
+    _: None = Depends(validate_api_key)
+):
+    compact = await load_or_scrape(date, request, scraper, planner)
+    return projection.day(compact)
+
+@router.get("/{date}/{section}", response_model=SectionArchive)
+async def get_section(
+    date: str,
+    section: str,
+    request: Request,
+    projection: Projection = Depends(),
+    scraper: ScraperService = Depends(get_scraper_service),
+    planner: PrefetchPlanner = Depends(get_prefetch_planner),
+    _: None = Depends(validate_api_key)
+):
+    # Checked first so a typo never triggers a scrape of the whole day.
+    validate_section(section)
+    compact = await load_or_scrape(date, request, scraper, planner)
+    return projection.section(compact, section)
\ No newline at end of file
@@ -0,0 +1,87 @@
+from fastapi import APIRouter, Depends, HTTPException, Response
+from app.services.archive import ArchiveService
+from app.services.rollover import RolloverScheduler
+from app.models.archive import DayArchive, SectionArchive
+from app.models.article import ArticleBody
+from app.repositories.article_repo import ArticleRepository
+from app.models.compact import CompactDay
+from app.dependencies import get_archive_service, get_rollover_scheduler, get_article_repository
+from app.core.security import validate_api_key
+from app.api.v1.endpoints.common import (
+    Projection,
+    load_fallback_data,
+    validate_date,
+    validate_section,
+)
+
+router = APIRouter(prefix="/archive", tags=["archive"])
+
+@router.get("/today", response_model=DayArchive)
+async def get_today(
+    projection: Projection = Depends(),
+    archive_service: ArchiveService = Depends(get_archive_service),
+    rollover: RolloverScheduler = Depends(get_rollover_scheduler),
+    _: None = Depends(validate_api_key)
+):
+    today = archive_service.get_todays_date()
+    
+    snapshot = rollover.get(today)
+    if snapshot:
+        if projection.is_full:
+            return Response(content=snapshot.body, media_type="application/json")
+        return projection.day(snapshot.compact)
+    
+    compact = await archive_service.load_compact(today)
+    
+    if not compact:
+        print(f"No data for today ({today}), loading fallback data")
+        try:
+            compact = CompactDay.from_archive(load_fallback_data(archive_service))
+        except HTTPException:
+            raise HTTPException(
+                status_code=404,
+                detail=f"No data for today ({today}) and no fallback available"
+            )
+    
+    return projection.day(compact)
+
+@router.get("/article/{article_id}", response_model=ArticleBody)
+async def get_article(
+    article_id: str,
+    repository: ArticleRepository = Depends(get_article_repository),
+    _: None = Depends(validate_api_key)
+):
+    body = await repository.load(article_id)
+    if body is None:
+        raise HTTPException(status_code=404, detail=f"No article body stored for {article_id}")
+    return body
+
+async def load_stored(date: str, archive_service: ArchiveService) -> CompactDay:
+    validate_date(date)
+    
+    compact = await archive_service.load_compact(date)
+    if not compact:
+        raise HTTPException(status_code=404, detail=f"No archive stored for {date}")
+    return compact
+
+@router.get("/{date}", response_model=DayArchive)
+async def get_date(
+    date: str,
+    projection: Projection = Depends(),
+    archive_service: ArchiveService = Depends(get_archive_service),
+    _: None = Depends(validate_api_key)
+):
+    compact = await load_stored(date, archive_service)
+    return projection.day(compact)
+
+@router.get("/{date}/{section}", response_model=SectionArchive)
+async def get_section(
+    date: str,
+    section: str,
+    projection: Projection = Depends(),
+    archive_service: ArchiveService = Depends(get_archive_service),
+    _: None = Depends(validate_api_key)
+):
+    validate_section(section)
+    compact = await load_stored(date, archive_service)
+    return projection.section(compact, section)
\ No newline at end of file
@@ -1,34 +1,44 @@
 from fastapi import APIRouter, Depends
-from app.dependencies import get_scraper_service
-from app.services.scraper import ScraperService
+from app.dependencies import get_archive_service, get_image_cache
+from app.services.archive import ArchiveService
+from app.services.images import ImageCache
 from app.core.security import validate_api_key
 
 router = APIRouter(prefix="/cache", tags=["cache"])
+# Destructive routes, mounted only by the full app: read-only replicas share DATA_DIR.
+admin_router = APIRouter(prefix="/cache", tags=["cache"])
 
 @router.get("/")
 async def get_cache_info(
-    scraper: ScraperService = Depends(get_scraper_service),
+    archive: ArchiveService = Depends(get_archive_service),
     _: None = Depends(validate_api_key)
 ):
     return {
-        "cached_dates": list(scraper.cache.keys()),
-        "count": len(scraper.cache)
+        "cached_dates": list(archive.cache.keys()),
+        "count": len(archive.cache)
     }
 
 @router.get("/files")
 async def get_files_info(
-    scraper: ScraperService = Depends(get_scraper_service),
+    archive: ArchiveService = Depends(get_archive_service),
     _: None = Depends(validate_api_key)
 ):
-    dates = await scraper.repository.list_all_dates()
+    dates = await archive.repository.list_all_dates()
     return {"files": dates, "count": len(dates)}
 
-@router.delete("/clear")
+@router.get("/images")
+async def get_images_info(
+    images: ImageCache = Depends(get_image_cache),
+    _: None = Depends(validate_api_key)
+):
+    return images.stats()
+
+@admin_router.delete("/clear")
 async def clear_all_files(
-    scraper: ScraperService = Depends(get_scraper_service),
+    archive: ArchiveService = Depends(get_archive_service),
     _: None = Depends(validate_api_key)
 ):
-    deleted_count, errors = await scraper.repository.delete_all_files()
+    deleted_count, errors = await archive.repository.delete_all_files()
     return {
         "deleted_count": deleted_count,
         "errors": errors
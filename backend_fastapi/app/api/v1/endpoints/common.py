@@ -0,0 +1,87 @@
+"""Request helpers shared by the full and read-only archive endpoints.
+
+Kept free of scraper and browser imports so read-only workers stay light.
+"""
+from datetime import datetime
+from fastapi import Depends, HTTPException, Query, Request, Response
+from app.services.archive import ArchiveService, SECTIONS
+from app.services.images import ImageCache
+from app.models.archive import DayArchive
+from app.models.compact import ARTICLE_FIELDS, CompactDay
+from app.config import settings
+from app.dependencies import get_image_cache
+
+def load_fallback_data(archive: ArchiveService) -> DayArchive:
+    try:
+        return archive.load_fallback()
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=503,
+            detail=f"Failed to load fallback data: {str(e)}"
+        )
+
+def client_key(request: Request) -> str:
+    forwarded = request.headers.get("x-forwarded-for")
+    if forwarded:
+        return forwarded.split(",")[0].strip()
+    return request.client.host if request.client else "unknown"
+
+def validate_date(date: str) -> None:
+    try:
+        datetime.strptime(date, '%Y-%m-%d')
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
+
+def _split(value: str | None, allowed, name: str) -> list[str] | None:
+    """Comma-separated names; empty means no filter and unknown names are a 400"""
+    items = [item.strip() for item in (value or "").split(",") if item.strip()]
+    if not items:
+        return None
+    
+    unknown = [item for item in items if item not in allowed]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown {name}: {', '.join(unknown)}")
+    return items
+
+def validate_section(section: str) -> None:
+    if section not in SECTIONS:
+        raise HTTPException(status_code=404, detail=f"Unknown section '{section}'")
+
+class Projection:
+    """Optional sections=, fields= and thumbnails= query parameters"""
+    
+    def __init__(
+        self,
+        request: Request,
+        sections: str | None = Query(None, description="Comma-separated sections to include"),
+        fields: str | None = Query(None, description=f"Comma-separated article fields: {', '.join(ARTICLE_FIELDS)}"),
+        thumbnails: bool = Query(False, description="Point imageUrl at resized, proxied thumbnails"),
+        images: ImageCache = Depends(get_image_cache)
+    ):
+        self.sections = _split(sections, SECTIONS, "sections")
+        self.fields = _split(fields, ARTICLE_FIELDS, "fields")
+        self.image_url = None
+        
+        if thumbnails:
+            base_url = (settings.PUBLIC_BASE_URL or str(request.base_url)).rstrip("/")
+            self.image_url = lambda url: images.proxy_url(url, base_url)
+    
+    @property
+    def is_full(self) -> bool:
+        return self.sections is None and self.fields is None and self.image_url is None
+    
+    def day(self, compact: CompactDay) -> Response:
+        return Response(
+            content=compact.to_json(self.sections, self.fields, self.image_url),
+            media_type="application/json"
+        )
+    
+    def section(self, compact: CompactDay, section: str) -> Response:
+        if section not in compact.sections:
+            raise HTTPException(status_code=404, detail=f"No section '{section}' for {compact.date}")
+        return Response(
+            content=compact.section_json(section, self.fields, self.image_url),
+            media_type="application/json"
+        )
\ No newline at end of file
@@ -0,0 +1,61 @@
+import os
+import tempfile
+from datetime import datetime, timezone
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import FileResponse, StreamingResponse
+from starlette.background import BackgroundTask
+from app.dependencies import get_archive_exporter
+from app.services.export import FORMATS, EXTENSIONS, ArchiveExporter, ExportUnavailableError, require_pyarrow
+from app.core.security import validate_api_key
+from app.api.v1.endpoints.common import validate_date
+
+router = APIRouter(prefix="/export", tags=["export"])
+
+@router.get("/")
+async def export_archive(
+    format: str = Query("ndjson", description=f"One of: {', '.join(FORMATS)}"),
+    start: str | None = Query(None, description="First date, YYYY-MM-DD"),
+    end: str | None = Query(None, description="Last date, YYYY-MM-DD"),
+    since: datetime | None = Query(None, description="Only days written after this time, e.g. a previous X-Export-Watermark"),
+    exporter: ArchiveExporter = Depends(get_archive_exporter),
+    _: None = Depends(validate_api_key)
+):
+    if format not in FORMATS:
+        raise HTTPException(status_code=400, detail=f"Unknown format: {format}")
+    for date in (start, end):
+        if date:
+            validate_date(date)
+    if format != "ndjson":
+        try:
+            require_pyarrow()
+        except ExportUnavailableError as e:
+            raise HTTPException(status_code=501, detail=str(e))
+    
+    # UTC with a "Z" suffix: an offset's "+" turns into a space when the
+    # value is pasted back into a URL unencoded.
+    watermark = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+    dates = await exporter.select_days(start, end, since)
+    headers = {
+        "X-Export-Watermark": watermark,
+        "X-Export-Days": str(len(dates)),
+        "Content-Disposition": f'attachment; filename="archive.{EXTENSIONS[format]}"',
+    }
+    
+    if format == "parquet":
+        # Parquet writes its footer last, so build the file on disk and send that.
+        fd, path = tempfile.mkstemp(suffix=".parquet")
+        os.close(fd)
+        try:
+            await exporter.write_parquet(dates, path)
+        except Exception:
+            os.unlink(path)
+            raise
+        return FileResponse(
+            path,
+            media_type=FORMATS[format],
+            headers=headers,
+            background=BackgroundTask(os.unlink, path)
+        )
+    
+    stream = exporter.stream_ndjson(dates) if format == "ndjson" else exporter.stream_arrow(dates)
+    return StreamingResponse(stream, media_type=FORMATS[format], headers=headers)
\ No newline at end of file
@@ -0,0 +1,48 @@
+from fastapi import APIRouter, Depends
+from app.dependencies import (
+    get_browser_watchdog,
+    get_scraper_service,
+    get_rollover_scheduler,
+    get_prefetch_planner,
+    get_article_fetcher,
+)
+from app.services.articles import ArticleFetcher
+from app.services.prefetch import PrefetchPlanner
+from app.services.rollover import RolloverScheduler
+from app.services.scraper import ScraperService
+from app.services.watchdog import BrowserWatchdog
+from app.core.security import validate_api_key
+
+router = APIRouter(prefix="/health", tags=["health"])
+
+@router.get("/")
+async def get_health(
+    watchdog: BrowserWatchdog = Depends(get_browser_watchdog),
+    rollover: RolloverScheduler = Depends(get_rollover_scheduler),
+    _: None = Depends(validate_api_key)
+):
+    return {**watchdog.health(), "rollover": rollover.status()}
+
+@router.get("/proxies")
+async def get_proxy_info(
+    scraper: ScraperService = Depends(get_scraper_service),
+    _: None = Depends(validate_api_key)
+):
+    return {
+        "proxies": scraper.browser.proxy_pool.stats(),
+        "rate_limits": scraper.rate_limiter.stats()
+    }
+
+@router.get("/prefetch")
+async def get_prefetch_info(
+    planner: PrefetchPlanner = Depends(get_prefetch_planner),
+    _: None = Depends(validate_api_key)
+):
+    return planner.stats()
+
+@router.get("/articles")
+async def get_article_info(
+    articles: ArticleFetcher = Depends(get_article_fetcher),
+    _: None = Depends(validate_api_key)
+):
+    return articles.stats()
\ No newline at end of file
@@ -0,0 +1,41 @@
+import re
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import FileResponse
+from app.config import settings
+from app.dependencies import get_image_cache
+from app.services.images import FORMATS, ImageCache, ImageFetchError, snap_width
+
+router = APIRouter(prefix="/images", tags=["images"])
+
+HASH_PATTERN = re.compile(r"[0-9a-f]{32}")
+
+# Served without an API key: browsers load these straight from <img> tags, and
+# only hashes of URLs already handed out in archive responses resolve.
+@router.get("/{image_hash}")
+async def get_image(
+    image_hash: str,
+    request: Request,
+    w: int = Query(settings.IMAGE_DEFAULT_WIDTH, ge=1, le=4096),
+    images: ImageCache = Depends(get_image_cache)
+):
+    if not HASH_PATTERN.fullmatch(image_hash):
+        raise HTTPException(status_code=404, detail="Unknown image")
+    
+    fmt = "webp" if "image/webp" in request.headers.get("accept", "") else "jpeg"
+    
+    try:
+        path = await images.get(image_hash, snap_width(w), fmt)
+    except ImageFetchError as e:
+        raise HTTPException(status_code=502, detail=str(e))
+    
+    if path is None:
+        raise HTTPException(status_code=404, detail="Unknown image")
+    
+    return FileResponse(
+        path,
+        media_type=FORMATS[fmt],
+        headers={
+            "Cache-Control": "public, max-age=31536000, immutable",
+            "Vary": "Accept",
+        }
+    )
\ No newline at end of file
@@ -1,6 +1,19 @@
 from fastapi import APIRouter
-from app.api.v1.endpoints import archive, cache
+from app.config import settings
 
 api_router = APIRouter()
-api_router.include_router(archive.router)
-api_router.include_router(cache.router)
\ No newline at end of file
+
+if settings.READ_ONLY:
+    from app.api.v1.endpoints import archive_read, cache, export, images
+    api_router.include_router(archive_read.router)
+    api_router.include_router(cache.router)
+    api_router.include_router(images.router)
+    api_router.include_router(export.router)
+else:
+    from app.api.v1.endpoints import archive, cache, export, health, images
+    api_router.include_router(archive.router)
+    api_router.include_router(cache.router)
+    api_router.include_router(cache.admin_router)
+    api_router.include_router(health.router)
+    api_router.include_router(images.router)
+    api_router.include_router(export.router)
\ No newline at end of file
@@ -10,17 +10,50 @@ class Settings(BaseSettings):
     API_V1_PREFIX: str = "/api/v1"
     PROJECT_NAME: str = "Dawn Archive API"
     VERSION: str = "3.0.0"
+    READ_ONLY: bool = False
     
     BASE_URL: str = "https://www.dawn.com/newspaper"
     DATA_DIR: Path = Path("./data")
     DELAY: int = 3
     
     PROXY_URL: str | None = None
+    PROXY_URLS: str | None = None
+    PROXY_COOLDOWN: float = 60.0
+    PROXY_MAX_COOLDOWN: float = 900.0
+    
+    RATE_LIMIT_INITIAL: float = 0.5
+    RATE_LIMIT_MIN: float = 0.05
+    RATE_LIMIT_MAX: float = 2.0
+    RATE_LIMIT_BURST: int = 2
+    RATE_LIMIT_INCREASE: float = 0.05
+    RATE_LIMIT_BACKOFF: float = 0.5
     
     HEADLESS: bool = True
     MAX_RETRIES: int = 2
     TIMEOUT: int = 90000
     
+    BROWSER_MAX_PAGES: int = 200
+    BROWSER_MAX_RSS_MB: int = 1024
+    WATCHDOG_INTERVAL: int = 30
+    
+    ROLLOVER_LEAD_MINUTES: int = 60
+    ROLLOVER_RETRY_INTERVAL: int = 300
+    
+    PREFETCH_DEPTH: int = 2
+    PREFETCH_MAX_PER_HOUR: int = 6
+    PREFETCH_HISTORY: int = 8
+    
+    ARTICLE_BODIES: bool = False
+    ARTICLE_CONCURRENCY: int = 4
+    ARTICLE_RATE_LIMIT_INITIAL: float = 1.0
+    ARTICLE_RATE_LIMIT_MAX: float = 4.0
+    
+    PUBLIC_BASE_URL: str | None = None
+    IMAGE_CACHE_MAX_MB: int = 256
+    IMAGE_DEFAULT_WIDTH: int = 320
+    IMAGE_QUALITY: int = 75
+    IMAGE_FETCH_TIMEOUT: float = 20.0
+    
     model_config = SettingsConfigDict(
         case_sensitive=True,
         extra="ignore", 
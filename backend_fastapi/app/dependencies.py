@@ -1,22 +1,104 @@
-from app.services.scraper import ScraperService
-from app.services.browser import BrowserManager
-from app.services.parser import HTMLParser
+from typing import TYPE_CHECKING
+from app.config import settings
+from app.services.archive import ArchiveService
+from app.services.rollover import RolloverScheduler
+from app.services.images import ImageCache
 from app.repositories.archive_repo import ArchiveRepository
+from app.repositories.article_repo import ArticleRepository
 
-_browser_manager: BrowserManager | None = None
-_scraper_service: ScraperService | None = None
+if TYPE_CHECKING:
+    from app.services.scraper import ScraperService
+    from app.services.browser import BrowserManager
+    from app.services.prefetch import PrefetchPlanner
+    from app.services.articles import ArticleFetcher
+    from app.services.export import ArchiveExporter
+    from app.services.watchdog import BrowserWatchdog
 
-async def get_browser_manager() -> BrowserManager:
+_browser_manager: "BrowserManager | None" = None
+_scraper_service: "ScraperService | None" = None
+_archive_service: ArchiveService | None = None
+_browser_watchdog: "BrowserWatchdog | None" = None
+_rollover_scheduler: RolloverScheduler | None = None
+_prefetch_planner: "PrefetchPlanner | None" = None
+_image_cache: ImageCache | None = None
+_article_fetcher: "ArticleFetcher | None" = None
+_article_repository: ArticleRepository | None = None
+_archive_exporter: "ArchiveExporter | None" = None
+
+async def get_browser_manager() -> "BrowserManager":
     global _browser_manager
     if _browser_manager is None:
+        from app.services.browser import BrowserManager
         _browser_manager = BrowserManager()
     return _browser_manager
 
-async def get_scraper_service() -> ScraperService:
+async def get_browser_watchdog() -> "BrowserWatchdog":
+    global _browser_watchdog
+    if _browser_watchdog is None:
+        from app.services.watchdog import BrowserWatchdog
+        browser = await get_browser_manager()
+        _browser_watchdog = BrowserWatchdog(browser)
+    return _browser_watchdog
+
+async def get_scraper_service() -> "ScraperService":
     global _scraper_service
     if _scraper_service is None:
+        from app.services.parser import HTMLParser
+        from app.services.scraper import ScraperService
         browser = await get_browser_manager()
         parser = HTMLParser()
         repository = ArchiveRepository()
         _scraper_service = ScraperService(browser, parser, repository)
-    return _scraper_service
\ No newline at end of file
+    return _scraper_service
+
+async def get_archive_service() -> ArchiveService:
+    global _archive_service
+    if _archive_service is None:
+        if settings.READ_ONLY:
+            _archive_service = ArchiveService(ArchiveRepository())
+        else:
+            _archive_service = await get_scraper_service()
+    return _archive_service
+
+async def get_rollover_scheduler() -> RolloverScheduler:
+    global _rollover_scheduler
+    if _rollover_scheduler is None:
+        archive = await get_archive_service()
+        _rollover_scheduler = RolloverScheduler(archive)
+    return _rollover_scheduler
+
+async def get_prefetch_planner() -> "PrefetchPlanner":
+    global _prefetch_planner
+    if _prefetch_planner is None:
+        from app.services.prefetch import PrefetchPlanner
+        scraper = await get_scraper_service()
+        _prefetch_planner = PrefetchPlanner(scraper)
+    return _prefetch_planner
+
+async def get_image_cache() -> ImageCache:
+    global _image_cache
+    if _image_cache is None:
+        _image_cache = ImageCache()
+    return _image_cache
+
+async def get_article_repository() -> ArticleRepository:
+    global _article_repository
+    if _article_repository is None:
+        _article_repository = ArticleRepository()
+    return _article_repository
+
+async def get_article_fetcher() -> "ArticleFetcher":
+    global _article_fetcher
+    if _article_fetcher is None:
+        from app.services.articles import ArticleFetcher
+        scraper = await get_scraper_service()
+        _article_fetcher = ArticleFetcher(scraper, await get_article_repository())
+    return _article_fetcher
+
+async def get_archive_exporter() -> "ArchiveExporter":
+    global _archive_exporter
+    if _archive_exporter is None:
+        from app.services.export import ArchiveExporter
+        archive = await get_archive_service()
+        _archive_exporter = ArchiveExporter(archive.repository)
+    return _archive_exporter
\ No newline at end of file
@@ -4,16 +4,46 @@ from fastapi.middleware.cors import CORSMiddleware
 from app.config import settings
 from app.api.v1.router import api_router
 from app.core.exceptions import register_exception_handlers
-from app.dependencies import get_browser_manager
+from app.dependencies import (
+    get_browser_manager,
+    get_browser_watchdog,
+    get_rollover_scheduler,
+    get_prefetch_planner,
+    get_image_cache,
+    get_article_fetcher,
+)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     print("=" * 50)
     print(f"Starting {settings.PROJECT_NAME} v{settings.VERSION}")
     print(f"API Key: {'SET' if settings.API_KEY else 'NOT SET'}")
-    print(f"Proxy: {'ENABLED' if settings.PROXY_URL else 'DISABLED'}")
+    print(f"Mode: {'READ-ONLY' if settings.READ_ONLY else 'FULL'}")
+    print(f"Proxy: {'ENABLED' if settings.PROXY_URL or settings.PROXY_URLS else 'DISABLED'}")
+    print(f"Article bodies: {'ENABLED' if settings.ARTICLE_BODIES else 'DISABLED'}")
     print("=" * 50)
+    rollover = await get_rollover_scheduler()
+    rollover.start()
+    images = await get_image_cache()
+    if settings.READ_ONLY:
+        yield
+        await rollover.stop()
+        await images.close()
+        return
+    
+    watchdog = await get_browser_watchdog()
+    watchdog.start()
+    planner = await get_prefetch_planner()
+    planner.start()
+    articles = await get_article_fetcher()
+    if settings.ARTICLE_BODIES:
+        articles.start()
     yield
+    await articles.stop()
+    await planner.stop()
+    await rollover.stop()
+    await watchdog.stop()
+    await images.close()
     print("\nShutting down, closing browser...")
     browser = await get_browser_manager()
     await browser.close()
@@ -39,16 +69,29 @@ register_exception_handlers(app)
 
 @app.get("/")
 async def root():
+    endpoints = {
+        "today": f"{settings.API_V1_PREFIX}/archive/today",
+        "date": f"{settings.API_V1_PREFIX}/archive/{{date}}",
+        "section": f"{settings.API_V1_PREFIX}/archive/{{date}}/{{section}}",
+        "article": f"{settings.API_V1_PREFIX}/archive/article/{{id}}",
+        "cache": f"{settings.API_V1_PREFIX}/cache",
+        "files": f"{settings.API_V1_PREFIX}/cache/files",
+        "images": f"{settings.API_V1_PREFIX}/cache/images",
+        "image": f"{settings.API_V1_PREFIX}/images/{{hash}}?w={{width}}",
+        "export": f"{settings.API_V1_PREFIX}/export?format=ndjson|parquet|arrow"
+    }
+    if not settings.READ_ONLY:
+        endpoints["clear"] = f"{settings.API_V1_PREFIX}/cache/clear"
+        endpoints["health"] = f"{settings.API_V1_PREFIX}/health"
+        endpoints["proxies"] = f"{settings.API_V1_PREFIX}/health/proxies"
+        endpoints["prefetch"] = f"{settings.API_V1_PREFIX}/health/prefetch"
+        endpoints["articles"] = f"{settings.API_V1_PREFIX}/health/articles"
+    
     return {
         "message": f"{settings.PROJECT_NAME} v{settings.VERSION}",
         "docs": "/docs",
-        "endpoints": {
-            "today": f"{settings.API_V1_PREFIX}/archive/today",
-            "date": f"{settings.API_V1_PREFIX}/archive/{{date}}",
-            "cache": f"{settings.API_V1_PREFIX}/cache",
-            "files": f"{settings.API_V1_PREFIX}/cache/files",
-            "clear": f"{settings.API_V1_PREFIX}/cache/clear"
-        }
+        "read_only": settings.READ_ONLY,
+        "endpoints": endpoints
     }
 
 if __name__ == "__main__":
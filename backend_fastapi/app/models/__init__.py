@@ -1,4 +1,5 @@
-from .article import Article
-from .archive import DayArchive
+from .article import Article, ArticleBody
+from .archive import DayArchive, SectionArchive
+from .compact import CompactDay
 
-__all__ = ["Article", "DayArchive"]
\ No newline at end of file
+__all__ = ["Article", "ArticleBody", "DayArchive", "SectionArchive", "CompactDay"]
\ No newline at end of file
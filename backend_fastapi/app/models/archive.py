@@ -5,4 +5,9 @@ from app.models.article import Article
 class DayArchive(BaseModel):
     date: str
     sections: Dict[str, List[Article]]
-    cached_at: Optional[str] = None
\ No newline at end of file
+    cached_at: Optional[str] = None
+
+class SectionArchive(BaseModel):
+    date: str
+    section: str
+    articles: List[Article]
\ No newline at end of file
@@ -1,10 +1,29 @@
+import hashlib
+import re
 from pydantic import BaseModel
 from typing import Optional
 
+NEWS_ID = re.compile(r"/news/(\d+)")
+
 class Article(BaseModel):
     title: str
     url: str
     summary: str
     section: str
     date: str
-    imageUrl: Optional[str] = None
\ No newline at end of file
+    imageUrl: Optional[str] = None
+
+class ArticleBody(BaseModel):
+    id: str
+    url: str
+    title: Optional[str] = None
+    author: Optional[str] = None
+    body: str
+    fetched_at: str
+
+def article_id(url: str) -> str:
+    """dawn.com's numeric story id from /news/{id}/..., or a hash for any other URL"""
+    match = NEWS_ID.search(url)
+    if match:
+        return match.group(1)
+    return hashlib.sha256(url.encode("utf-8")).hexdigest()[:16]
\ No newline at end of file
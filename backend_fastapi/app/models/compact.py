@@ -0,0 +1,172 @@
+import sys
+from itertools import repeat
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from pydantic_core import to_json
+from app.models.archive import DayArchive
+from app.models.article import Article
+
+# Longest prefixes first so the most specific one wins. A compressed URL is
+# the prefix index as a single character followed by the remainder.
+URL_PREFIXES = (
+    "https://www.dawn.com/news/",
+    "https://i.dawn.com/thumbnail/",
+    "https://i.dawn.com/",
+    "https://www.dawn.com/",
+    "https://",
+    "",
+)
+
+ARTICLE_FIELDS = tuple(Article.model_fields)
+
+def compress_url(url: str) -> str:
+    for index, prefix in enumerate(URL_PREFIXES):
+        if url.startswith(prefix):
+            return chr(index) + url[len(prefix):]
+    return chr(len(URL_PREFIXES) - 1) + url
+
+def expand_url(packed: str) -> str:
+    return URL_PREFIXES[ord(packed[0])] + packed[1:]
+
+class CompactSection:
+    """Column-oriented storage for one section's articles"""
+
+    __slots__ = ("titles", "urls", "summaries", "images")
+
+    def __init__(
+        self,
+        titles: Tuple[str, ...],
+        urls: Tuple[str, ...],
+        summaries: Tuple[str, ...],
+        images: Tuple[Optional[str], ...],
+    ):
+        self.titles = titles
+        self.urls = urls
+        self.summaries = summaries
+        self.images = images
+
+    @classmethod
+    def from_articles(cls, articles: List[Article]) -> "CompactSection":
+        return cls(
+            tuple(a.title for a in articles),
+            tuple(compress_url(a.url) for a in articles),
+            tuple(a.summary for a in articles),
+            tuple(compress_url(a.imageUrl) if a.imageUrl else None for a in articles),
+        )
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    def _column(
+        self,
+        field: str,
+        section: str,
+        date: str,
+        image_url: Optional[Callable[[str], str]] = None
+    ) -> Iterable:
+        if field == "title":
+            return self.titles
+        if field == "url":
+            return map(expand_url, self.urls)
+        if field == "summary":
+            return self.summaries
+        if field == "section":
+            return repeat(section, len(self))
+        if field == "date":
+            return repeat(date, len(self))
+        if field == "imageUrl":
+            rewrite = image_url or (lambda url: url)
+            return (rewrite(expand_url(image)) if image else None for image in self.images)
+        raise ValueError(f"Unknown article field: {field}")
+
+    def rows(
+        self,
+        section: str,
+        date: str,
+        fields: Sequence[str] = ARTICLE_FIELDS,
+        image_url: Optional[Callable[[str], str]] = None
+    ) -> List[dict]:
+        """Article dicts holding only the requested fields; other columns are never expanded"""
+        columns = [self._column(field, section, date, image_url) for field in fields]
+        return [dict(zip(fields, values)) for values in zip(*columns)]
+
+class CompactDay:
+    """Memory-lean form of a DayArchive kept in the hot cache.
+
+    Section and date strings are interned and stored once instead of on every
+    article; convert back with to_archive() or to_json() at the API boundary.
+    """
+
+    __slots__ = ("date", "cached_at", "sections", "_body")
+
+    def __init__(self, date: str, cached_at: Optional[str], sections: Dict[str, CompactSection]):
+        self.date = date
+        self.cached_at = cached_at
+        self.sections = sections
+        self._body: Optional[bytes] = None
+
+    @classmethod
+    def from_archive(cls, archive: DayArchive) -> "CompactDay":
+        return cls(
+            sys.intern(archive.date),
+            archive.cached_at,
+            {
+                sys.intern(section): CompactSection.from_articles(articles)
+                for section, articles in archive.sections.items()
+            },
+        )
+
+    def article_count(self) -> int:
+        return sum(len(s) for s in self.sections.values())
+
+    def to_dict(
+        self,
+        sections: Optional[Sequence[str]] = None,
+        fields: Optional[Sequence[str]] = None,
+        image_url: Optional[Callable[[str], str]] = None
+    ) -> dict:
+        wanted = self.sections if sections is None else [s for s in sections if s in self.sections]
+        return {
+            "date": self.date,
+            "sections": {
+                section: self.sections[section].rows(section, self.date, fields or ARTICLE_FIELDS, image_url)
+                for section in wanted
+            },
+            "cached_at": self.cached_at,
+        }
+
+    def to_archive(self) -> DayArchive:
+        return DayArchive.model_validate(self.to_dict())
+
+    def to_json(
+        self,
+        sections: Optional[Sequence[str]] = None,
+        fields: Optional[Sequence[str]] = None,
+        image_url: Optional[Callable[[str], str]] = None
+    ) -> bytes:
+        """Same document as DayArchive.model_dump_json(), without building the models.
+
+        Passing sections and/or fields projects the document down to just those;
+        image_url rewrites each article's imageUrl, e.g. to a proxied thumbnail.
+        The unprojected document is built once and kept, since it is by far
+        the most requested one.
+        """
+        if sections is None and fields is None and image_url is None:
+            if self._body is None:
+                self._body = _dumps(self.to_dict())
+            return self._body
+        return _dumps(self.to_dict(sections, fields, image_url))
+
+    def section_json(
+        self,
+        section: str,
+        fields: Optional[Sequence[str]] = None,
+        image_url: Optional[Callable[[str], str]] = None
+    ) -> bytes:
+        return _dumps({
+            "date": self.date,
+            "section": section,
+            "articles": self.sections[section].rows(section, self.date, fields or ARTICLE_FIELDS, image_url),
+        })
+
+def _dumps(document: dict) -> bytes:
+    return to_json(document)
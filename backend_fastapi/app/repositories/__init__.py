@@ -1,3 +1,4 @@
 from .archive_repo import ArchiveRepository
+from .article_repo import ArticleRepository
 
-__all__ = ["ArchiveRepository"]
\ No newline at end of file
+__all__ = ["ArchiveRepository", "ArticleRepository"]
\ No newline at end of file
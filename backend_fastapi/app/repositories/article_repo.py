@@ -0,0 +1,33 @@
+from typing import Optional
+import aiofiles
+from app.models.article import ArticleBody
+from app.config import settings
+
+class ArticleRepository:
+    """Full article bodies, one {id}.json per story under DATA_DIR/articles"""
+    
+    def __init__(self):
+        self.data_dir = settings.DATA_DIR / "articles"
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+    
+    async def save(self, article: ArticleBody) -> None:
+        file_path = self.data_dir / f"{article.id}.json"
+        tmp_path = file_path.with_suffix(".tmp")
+        async with aiofiles.open(tmp_path, 'w', encoding='utf-8') as f:
+            await f.write(article.model_dump_json())
+        tmp_path.replace(file_path)
+    
+    async def load(self, article_id: str) -> Optional[ArticleBody]:
+        file_path = self.data_dir / f"{article_id}.json"
+        if not file_path.exists():
+            return None
+        
+        async with aiofiles.open(file_path, 'r', encoding='utf-8') as f:
+            content = await f.read()
+            return ArticleBody.model_validate_json(content)
+    
+    def exists(self, article_id: str) -> bool:
+        return (self.data_dir / f"{article_id}.json").exists()
+    
+    def count(self) -> int:
+        return sum(1 for _ in self.data_dir.glob("*.json"))
\ No newline at end of file
@@ -1,5 +1,18 @@
-from .fingerprint import FingerprintGenerator
-from .browser import BrowserManager
-from .scraper import ScraperService
+from importlib import import_module
 
-__all__ = ["FingerprintGenerator", "BrowserManager", "ScraperService"]
\ No newline at end of file
+# Resolved on first access so that read-only workers never import Playwright
+# or BeautifulSoup just by touching the package.
+_EXPORTS = {
+    "FingerprintGenerator": ".fingerprint",
+    "BrowserManager": ".browser",
+    "ArchiveService": ".archive",
+    "ScraperService": ".scraper",
+    "BrowserWatchdog": ".watchdog",
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name: str):
+    if name in _EXPORTS:
+        return getattr(import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
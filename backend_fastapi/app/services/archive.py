@@ -0,0 +1,63 @@
+import json
+import pytz
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict
+from app.repositories.archive_repo import ArchiveRepository
+from app.models.archive import DayArchive
+from app.models.compact import CompactDay
+
+PKT = pytz.timezone("Asia/Karachi")
+FALLBACK_PATH = Path("fallback_data/fallback.json")
+
+SECTIONS = [
+    'front-page', 'national', 'business', 'international',
+    'sport', 'editorial', 'back-page', 'other-voices',
+    'letters', 'books-authors', 'business-finance',
+    'young-world', 'sunday-magzine', 'icon'
+]
+
+# Printed every day; the rest are weekly supplements and are often legitimately empty.
+DAILY_SECTIONS = [
+    'front-page', 'national', 'business', 'international',
+    'sport', 'editorial', 'back-page', 'letters'
+]
+
+class ArchiveService:
+    """Read side of the archive: date helpers, in-memory cache and stored days"""
+
+    def __init__(self, repository: ArchiveRepository):
+        self.repository = repository
+        self.cache: Dict[str, CompactDay] = {}
+
+    def get_todays_date(self) -> str:
+        now = datetime.now(PKT)
+        past = now.replace(year=now.year - 12)
+        return past.strftime('%Y-%m-%d')
+
+    def get_tomorrows_date(self) -> str:
+        today_str = self.get_todays_date()
+        today_dt = datetime.strptime(today_str, '%Y-%m-%d')
+        tomorrow_dt = today_dt + timedelta(days=1)
+        return tomorrow_dt.strftime('%Y-%m-%d')
+
+    def remember(self, archive: DayArchive) -> CompactDay:
+        compact = CompactDay.from_archive(archive)
+        self.cache[archive.date] = compact
+        return compact
+
+    async def load_compact(self, date_string: str) -> CompactDay | None:
+        compact = self.cache.get(date_string)
+        if compact is None:
+            archive = await self.repository.load(date_string)
+            if archive:
+                compact = self.remember(archive)
+        return compact
+
+    def load_fallback(self) -> DayArchive:
+        if not FALLBACK_PATH.exists():
+            raise FileNotFoundError("No data available and fallback file not found")
+
+        with open(FALLBACK_PATH, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return DayArchive(**data)
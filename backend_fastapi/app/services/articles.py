@@ -0,0 +1,121 @@
+import asyncio
+from typing import Dict
+from urllib.parse import urlsplit
+from app.config import settings
+from app.models.archive import DayArchive
+from app.models.article import ArticleBody, article_id
+from app.repositories.article_repo import ArticleRepository
+from app.services.rate_limiter import AdaptiveRateLimiter
+from app.services.scraper import ScraperService
+from app.services.tasks import BackgroundWorker, Coalescer
+
+class ArticleFetcher(BackgroundWorker):
+    """Fetches full story pages for scraped days with a bounded number of concurrent pages"""
+
+    def __init__(self, scraper: ScraperService, repository: ArticleRepository):
+        self.scraper = scraper
+        self.repository = repository
+        self.concurrency = settings.ARTICLE_CONCURRENCY
+        self.semaphore = asyncio.Semaphore(self.concurrency)
+        # A bucket of its own: a backlog of stories never delays listing
+        # scrapes such as the rollover's preparation of tomorrow.
+        self.rate_limiter = AdaptiveRateLimiter(
+            settings.ARTICLE_RATE_LIMIT_INITIAL,
+            settings.ARTICLE_RATE_LIMIT_MAX,
+            burst=self.concurrency
+        )
+        self.queue: asyncio.Queue[DayArchive] = asyncio.Queue()
+        self.inflight = Coalescer()
+
+        self.fetched = 0
+        self.skipped = 0
+        self.failed = 0
+
+    def start(self) -> None:
+        """Fetch bodies in the background for every day the scraper saves"""
+        if not self.running:
+            self.scraper.on_saved.append(self.enqueue)
+        super().start()
+
+    async def stop(self) -> None:
+        if self.enqueue in self.scraper.on_saved:
+            self.scraper.on_saved.remove(self.enqueue)
+        await super().stop()
+
+    def enqueue(self, archive: DayArchive) -> None:
+        self.queue.put_nowait(archive)
+
+    async def _run(self) -> None:
+        while True:
+            archive = await self.queue.get()
+            try:
+                await self.fetch_day(archive)
+            except Exception as e:
+                print(f"Article fetch failed for {archive.date}: {e}")
+
+    async def fetch_day(self, archive: DayArchive) -> int:
+        """Fetch every article of a day not already stored; returns how many were stored"""
+        urls: Dict[str, str] = {}
+        for articles in archive.sections.values():
+            for article in articles:
+                urls.setdefault(article_id(article.url), article.url)
+
+        pending = [(aid, url) for aid, url in urls.items() if not self.repository.exists(aid)]
+        self.skipped += len(urls) - len(pending)
+        if not pending:
+            return 0
+
+        print(f"Fetching {len(pending)} article bodies for {archive.date} ({self.concurrency} at a time)")
+        await self.scraper.browser.init_browser()
+        results = await asyncio.gather(*(self.fetch(aid, url) for aid, url in pending))
+
+        stored = sum(1 for body in results if body)
+        print(f"Stored {stored}/{len(pending)} article bodies for {archive.date}")
+        return stored
+
+    async def fetch(self, aid: str, url: str) -> ArticleBody | None:
+        """Fetch one story, joining a fetch of the same story that is already running"""
+        return await self.inflight.run(aid, lambda: self._fetch(aid, url))
+
+    async def _fetch(self, aid: str, url: str) -> ArticleBody | None:
+        async with self.semaphore:
+            try:
+                # No session key: stories are independent, so spread them over every proxy.
+                html = await self.scraper.fetch_page(url, settle=False, rate_limiter=self.rate_limiter)
+            except Exception as e:
+                print(f"  ✗ Failed to fetch article {aid}: {e}")
+                self.failed += 1
+                return None
+
+        body = self.scraper.parser.parse_article(html, url)
+        if body is None:
+            print(f"  ⚠ No body found in {url}")
+            self.failed += 1
+            return None
+
+        body.id = aid
+        await self.repository.save(body)
+        self.fetched += 1
+        return body
+
+    async def get(self, aid: str) -> ArticleBody | None:
+        """Stored body, or fetch it now when the id is a dawn.com story number"""
+        body = await self.repository.load(aid)
+        if body is None and aid.isdigit():
+            parts = urlsplit(self.scraper.base_url)
+            await self.scraper.browser.init_browser()
+            body = await self.fetch(aid, f"{parts.scheme}://{parts.netloc}/news/{aid}")
+        return body
+
+    def stats(self) -> dict:
+        return {
+            "enabled": settings.ARTICLE_BODIES,
+            "concurrency": self.concurrency,
+            "stored": self.repository.count(),
+            "fetched": self.fetched,
+            "skipped": self.skipped,
+            "failed": self.failed,
+            "queued_days": self.queue.qsize(),
+            "inflight": len(self.inflight),
+            "rate_limits": self.rate_limiter.stats(),
+        }
\ No newline at end of file
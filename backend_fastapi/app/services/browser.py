@@ -1,56 +1,157 @@
-import re
+import asyncio
+import time
 from playwright.async_api import async_playwright, Browser, BrowserContext
 from app.config import settings
 from app.services.fingerprint import FingerprintGenerator
+from app.services.proxy_pool import Proxy, ProxyPool
 
 class BrowserManager:
     def __init__(self):
         self.browser: Browser | None = None
         self.playwright = None
-        self.proxy_url = settings.PROXY_URL 
+        self.proxy_pool = ProxyPool.from_settings()
+        
+        self.launches = 0
+        self.crashes = 0
+        self.launched_at: float | None = None
+        self.pages_since_launch = 0
+        self.total_pages = 0
+        self.active_contexts = 0
+        self.recycle_reason: str | None = None
+        self._contexts: set[BrowserContext] = set()
+        self._closing = False
+        self._lock = asyncio.Lock()
+        self._idle = asyncio.Event()
+        self._idle.set()
     
     async def init_browser(self) -> Browser:
-        if not self.browser:
-            self.playwright = await async_playwright().start()
-            self.browser = await self.playwright.chromium.launch(
-                headless=settings.HEADLESS,
-                args=[
-                    '--no-sandbox',
-                    '--disable-setuid-sandbox',
-                    '--disable-blink-features=AutomationControlled',
-                    '--disable-dev-shm-usage',
-                    '--disable-web-security',
-                    '--disable-features=IsolateOrigins,site-per-process',
-                    '--disable-site-isolation-trials',
-                    '--disable-infobars',
-                    '--window-size=1920,1080',
-                    '--start-maximized',
-                ]
-            )
+        async with self._lock:
+            if self.browser and not self.browser.is_connected():
+                print("Browser disconnected, restarting...")
+                self.crashes += 1
+                await self._shutdown()
+            
+            if not self.browser:
+                await self._launch()
         return self.browser
     
-    async def create_stealth_context(self) -> BrowserContext:
+    async def _launch(self) -> None:
+        self.playwright = await async_playwright().start()
+        self.browser = await self.playwright.chromium.launch(
+            headless=settings.HEADLESS,
+            args=[
+                '--no-sandbox',
+                '--disable-setuid-sandbox',
+                '--disable-blink-features=AutomationControlled',
+                '--disable-dev-shm-usage',
+                '--disable-web-security',
+                '--disable-features=IsolateOrigins,site-per-process',
+                '--disable-site-isolation-trials',
+                '--disable-infobars',
+                '--window-size=1920,1080',
+                '--start-maximized',
+            ]
+        )
+        self.browser.on("disconnected", self._on_disconnected)
+        self.launches += 1
+        self.launched_at = time.monotonic()
+        self.pages_since_launch = 0
+    
+    def _on_disconnected(self, browser: Browser) -> None:
+        if not self._closing:
+            print("⚠ Browser disconnected unexpectedly")
+    
+    async def _shutdown(self) -> None:
+        self._closing = True
+        try:
+            if self.browser:
+                try:
+                    await self.browser.close()
+                except Exception as e:
+                    print(f"Error closing browser: {e}")
+                self.browser = None
+            if self.playwright:
+                try:
+                    await self.playwright.stop()
+                except Exception as e:
+                    print(f"Error stopping playwright: {e}")
+                self.playwright = None
+        finally:
+            self._closing = False
+            self._contexts.clear()
+            self.active_contexts = 0
+            self._idle.set()
+    
+    def request_recycle(self, reason: str) -> None:
+        if not self.recycle_reason:
+            print(f"Browser recycle requested: {reason}")
+            self.recycle_reason = reason
+    
+    async def recycle_if_idle(self) -> bool:
+        if not self.recycle_reason or self.active_contexts:
+            return False
+        await self._recycle()
+        return True
+    
+    async def _recycle(self) -> None:
+        await self._idle.wait()
+        async with self._lock:
+            if not self.recycle_reason:
+                return
+            print(f"Recycling browser ({self.recycle_reason})")
+            await self._shutdown()
+            self.recycle_reason = None
+    
+    async def recover(self) -> bool:
+        """Tear down a crashed browser so the next request relaunches it"""
+        async with self._lock:
+            if not self.browser or self.browser.is_connected():
+                return False
+            print("Browser disconnected, cleaning up crashed process")
+            self.crashes += 1
+            await self._shutdown()
+            return True
+    
+    def _release_context(self, context: BrowserContext | None = None) -> None:
+        if context is not None:
+            if context not in self._contexts:
+                return
+            self._contexts.discard(context)
+        if self.active_contexts > 0:
+            self.active_contexts -= 1
+        if self.active_contexts == 0:
+            self._idle.set()
+    
+    async def create_stealth_context(self, proxy: Proxy | None = None) -> BrowserContext:
+        if self.recycle_reason:
+            await self._recycle()
+        
+        self.active_contexts += 1
+        self._idle.clear()
+        try:
+            context = await self._new_stealth_context(proxy)
+        except Exception:
+            self._release_context()
+            raise
+        
+        self._contexts.add(context)
+        context.on("close", self._release_context)
+        
+        self.pages_since_launch += 1
+        self.total_pages += 1
+        if settings.BROWSER_MAX_PAGES and self.pages_since_launch >= settings.BROWSER_MAX_PAGES:
+            self.request_recycle(f"served {self.pages_since_launch} pages")
+        
+        return context
+    
+    async def _new_stealth_context(self, proxy: Proxy | None) -> BrowserContext:
         browser = await self.init_browser()
         fingerprint = FingerprintGenerator.get_random_fingerprint()
         
         proxy_config = None
-        if self.proxy_url:
-            proxy_str = self.proxy_url
-
-            m = re.match(r"http://([^:]+):([^@]+)@(.+)", proxy_str)
-            if not m:
-                raise ValueError(f"Invalid PROXY_URL format: {proxy_str}")
-
-            username, password, server = m.groups()
-
-            print(f"  Using proxy server: {server}")
-            print(f"  Using proxy username: {username}")
-
-            proxy_config = {
-                "server": f"http://{server}",
-                "username": username,
-                "password": password
-            }
+        if proxy:
+            print(f"  Using proxy server: {proxy.server}")
+            proxy_config = proxy.to_playwright()
         
         context = await browser.new_context(
             viewport=fingerprint["viewport"],
@@ -204,10 +305,20 @@ class BrowserManager:
         
         return context
     
+    def health(self) -> dict:
+        connected = bool(self.browser and self.browser.is_connected())
+        return {
+            "connected": connected,
+            "launches": self.launches,
+            "restarts": max(0, self.launches - 1),
+            "crashes": self.crashes,
+            "uptime": round(time.monotonic() - self.launched_at, 1) if connected else None,
+            "pages_since_launch": self.pages_since_launch,
+            "total_pages": self.total_pages,
+            "active_contexts": self.active_contexts,
+            "recycle_pending": self.recycle_reason,
+        }
+    
     async def close(self):
-        if self.browser:
-            await self.browser.close()
-            self.browser = None
-        if self.playwright:
-            await self.playwright.stop()
-            self.playwright = None
\ No newline at end of file
+        async with self._lock:
+            await self._shutdown()
\ No newline at end of file
@@ -0,0 +1,276 @@
+"""Bulk export of the stored archive as one row per article.
+
+Days are read and written one at a time straight from their JSON files, so
+memory stays flat however large the archive grows. Parquet and Arrow use
+pyarrow, which is imported only when one of them is requested so workers
+that never export don't pay for loading it.
+
+    cd backend_fastapi
+    python -m app.services.export --format ndjson > archive.ndjson
+    python -m app.services.export --format parquet --out exports/ --start 2013-12-01
+
+With --out, each day becomes its own file and a manifest records what was
+exported, so later runs rewrite only days whose source file changed.
+"""
+import argparse
+import asyncio
+import io
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import AsyncIterator, Iterator, List, Tuple
+import aiofiles
+from pydantic_core import from_json, to_json
+from app.models.article import article_id
+from app.repositories.archive_repo import ArchiveRepository
+
+EXPORT_FIELDS = ("id", "date", "section", "title", "url", "summary", "imageUrl")
+FORMATS = {"ndjson": "application/x-ndjson", "parquet": "application/vnd.apache.parquet", "arrow": "application/vnd.apache.arrow.stream"}
+EXTENSIONS = {"ndjson": "ndjson", "parquet": "parquet", "arrow": "arrows"}
+MANIFEST = "_manifest.json"
+
+class ExportUnavailableError(Exception):
+    """Raised when a columnar format is requested without pyarrow installed"""
+
+def require_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError:
+        raise ExportUnavailableError("Parquet and Arrow export need pyarrow: pip install pyarrow")
+    return pyarrow
+
+def _schema():
+    pa = require_pyarrow()
+    return pa.schema([
+        (field, pa.dictionary(pa.int32(), pa.string()) if field in ("date", "section") else pa.string())
+        for field in EXPORT_FIELDS
+    ])
+
+class ArchiveExporter:
+    """Streams stored days as article rows in NDJSON, Parquet or Arrow"""
+
+    def __init__(self, repository: ArchiveRepository):
+        self.repository = repository
+
+    def _path(self, date_string: str) -> Path:
+        return self.repository.data_dir / f"{date_string}.json"
+
+    async def select_days(
+        self,
+        start: str | None = None,
+        end: str | None = None,
+        since: datetime | None = None
+    ) -> List[str]:
+        """Stored dates within [start, end], optionally only those written after since"""
+        dates = [
+            d for d in await self.repository.list_all_dates()
+            if (start is None or d >= start) and (end is None or d <= end)
+        ]
+        if since is not None:
+            cutoff = since.timestamp()
+            dates = [d for d in dates if self._path(d).stat().st_mtime > cutoff]
+        return dates
+
+    async def read_day(self, date_string: str) -> dict | None:
+        """The raw day document, skipping DayArchive validation"""
+        try:
+            async with aiofiles.open(self._path(date_string), 'rb') as f:
+                return from_json(await f.read())
+        except FileNotFoundError:
+            return None
+
+    def _read_day_sync(self, date_string: str) -> dict | None:
+        try:
+            return from_json(self._path(date_string).read_bytes())
+        except FileNotFoundError:
+            return None
+
+    def rows(self, day: dict) -> Iterator[dict]:
+        date = day["date"]
+        for section, articles in day["sections"].items():
+            for article in articles:
+                yield {
+                    "id": article_id(article["url"]),
+                    "date": date,
+                    "section": section,
+                    "title": article["title"],
+                    "url": article["url"],
+                    "summary": article["summary"],
+                    "imageUrl": article.get("imageUrl"),
+                }
+
+    async def days(self, dates: List[str]) -> AsyncIterator[Tuple[str, List[dict]]]:
+        for date_string in dates:
+            day = await self.read_day(date_string)
+            if day is not None:
+                yield date_string, list(self.rows(day))
+
+    def _ndjson(self, rows: List[dict]) -> bytes:
+        return b"".join(to_json(row) + b"\n" for row in rows)
+
+    def _batch(self, rows: List[dict]):
+        pa = require_pyarrow()
+        return pa.RecordBatch.from_pylist(rows, schema=_schema())
+
+    async def stream_ndjson(self, dates: List[str]) -> AsyncIterator[bytes]:
+        async for _, rows in self.days(dates):
+            if rows:
+                yield self._ndjson(rows)
+
+    async def stream_arrow(self, dates: List[str]) -> AsyncIterator[bytes]:
+        """Arrow IPC stream, one record batch per day, flushed as each day is written"""
+        pa = require_pyarrow()
+        sink = io.BytesIO()
+        writer = pa.ipc.new_stream(sink, _schema())
+
+        def drain() -> bytes:
+            chunk = sink.getvalue()
+            sink.seek(0)
+            sink.truncate()
+            return chunk
+
+        async for _, rows in self.days(dates):
+            if rows:
+                writer.write_batch(self._batch(rows))
+                yield drain()
+        writer.close()
+        yield drain()
+
+    async def write_parquet(self, dates: List[str], path: Path) -> int:
+        """Write a single Parquet file with one row group per day, returns the row count.
+
+        Encoding and compression are CPU-bound, so the whole file is built in
+        a worker thread instead of stalling other requests.
+        """
+        require_pyarrow()
+        return await asyncio.to_thread(self._write_parquet, dates, path)
+
+    def _write_parquet(self, dates: List[str], path: Path) -> int:
+        pa = require_pyarrow()
+        written = 0
+        with pa.parquet.ParquetWriter(path, _schema(), compression="zstd") as writer:
+            for date_string in dates:
+                day = self._read_day_sync(date_string)
+                rows = list(self.rows(day)) if day else []
+                if rows:
+                    writer.write_batch(self._batch(rows))
+                    written += len(rows)
+        return written
+
+    async def _write_day(self, rows: List[dict], fmt: str, path: Path) -> None:
+        await asyncio.to_thread(self._write_day_file, rows, fmt, path)
+
+    def _write_day_file(self, rows: List[dict], fmt: str, path: Path) -> None:
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        if fmt == "ndjson":
+            tmp.write_bytes(self._ndjson(rows))
+        elif fmt == "parquet":
+            pa = require_pyarrow()
+            pa.parquet.write_table(pa.Table.from_batches([self._batch(rows)]), tmp, compression="zstd")
+        else:
+            pa = require_pyarrow()
+            with pa.ipc.new_stream(str(tmp), _schema()) as writer:
+                writer.write_batch(self._batch(rows))
+        tmp.replace(path)
+
+    async def export_incremental(
+        self,
+        out_dir: Path,
+        fmt: str,
+        start: str | None = None,
+        end: str | None = None,
+        full: bool = False
+    ) -> dict:
+        """Write one file per day into out_dir, skipping days unchanged since the last run.
+
+        Days that have since been pruned from DATA_DIR keep their exported file.
+        """
+        if fmt != "ndjson":
+            require_pyarrow()
+        out_dir.mkdir(parents=True, exist_ok=True)
+        manifest_path = out_dir / MANIFEST
+        manifest = {}
+        if manifest_path.exists() and not full:
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        if manifest.get("format") != fmt:
+            manifest = {"format": fmt, "days": {}}
+
+        exported, unchanged, rows_written = [], 0, 0
+        for date_string in await self.select_days(start, end):
+            stat = self._path(date_string).stat()
+            stamp = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+            previous = manifest["days"].get(date_string, {})
+            target = out_dir / f"{date_string}.{EXTENSIONS[fmt]}"
+            if target.exists() and all(previous.get(k) == v for k, v in stamp.items()):
+                unchanged += 1
+                continue
+
+            day = await self.read_day(date_string)
+            if day is None:
+                continue
+            rows = list(self.rows(day))
+            await self._write_day(rows, fmt, target)
+            manifest["days"][date_string] = {**stamp, "rows": len(rows)}
+            exported.append(date_string)
+            rows_written += len(rows)
+
+        manifest["exported_at"] = datetime.now().isoformat()
+        tmp = manifest_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+        tmp.replace(manifest_path)
+
+        return {
+            "format": fmt,
+            "out": str(out_dir),
+            "exported": exported,
+            "unchanged": unchanged,
+            "rows": rows_written,
+        }
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--format", choices=list(FORMATS), default="ndjson")
+    parser.add_argument("--start", default=None, help="first date to export, YYYY-MM-DD")
+    parser.add_argument("--end", default=None, help="last date to export, YYYY-MM-DD")
+    parser.add_argument("--out", type=Path, default=None, help="directory for incremental per-day files")
+    parser.add_argument("--file", type=Path, default=None, help="write a single file instead of stdout")
+    parser.add_argument("--full", action="store_true", help="with --out, ignore the manifest and rewrite every day")
+    return parser
+
+async def run(args: argparse.Namespace) -> None:
+    exporter = ArchiveExporter(ArchiveRepository())
+
+    if args.out:
+        summary = await exporter.export_incremental(args.out, args.format, args.start, args.end, args.full)
+        print(
+            f"Exported {len(summary['exported'])} days ({summary['rows']} rows) to {summary['out']}, "
+            f"{summary['unchanged']} unchanged",
+            file=sys.stderr
+        )
+        return
+
+    dates = await exporter.select_days(args.start, args.end)
+    if args.format == "parquet":
+        if args.file is None:
+            raise SystemExit("Parquet needs --file or --out")
+        rows = await exporter.write_parquet(dates, args.file)
+        print(f"Wrote {rows} rows from {len(dates)} days to {args.file}", file=sys.stderr)
+        return
+
+    stream = exporter.stream_ndjson(dates) if args.format == "ndjson" else exporter.stream_arrow(dates)
+    out = args.file.open("wb") if args.file else sys.stdout.buffer
+    try:
+        async for chunk in stream:
+            out.write(chunk)
+    finally:
+        if args.file:
+            out.close()
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(run(build_parser().parse_args()))
+    except ExportUnavailableError as e:
+        raise SystemExit(str(e))
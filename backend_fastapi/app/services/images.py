@@ -0,0 +1,251 @@
+import asyncio
+import hashlib
+import io
+import os
+import time
+from pathlib import Path
+from typing import Dict, TYPE_CHECKING
+from app.config import settings
+from app.services.fingerprint import FingerprintGenerator
+from app.services.tasks import Coalescer
+
+if TYPE_CHECKING:
+    import httpx
+
+IMAGE_WIDTHS = (160, 320, 480, 640, 960, 1280)
+FORMATS = {"webp": "image/webp", "jpeg": "image/jpeg"}
+MAX_ORIGINAL_BYTES = 15 * 1024 * 1024
+# Files touched this recently are never evicted, so a path handed to a
+# FileResponse is still there when the response is sent.
+EVICT_GRACE = 60
+
+class ImageFetchError(Exception):
+    """Raised when an upstream image cannot be downloaded or decoded"""
+
+def image_hash(url: str) -> str:
+    return hashlib.sha256(url.encode("utf-8")).hexdigest()[:32]
+
+def snap_width(width: int) -> int:
+    """Round up to one of a few fixed widths so the number of variants stays bounded"""
+    for candidate in IMAGE_WIDTHS:
+        if width <= candidate:
+            return candidate
+    return IMAGE_WIDTHS[-1]
+
+def _resize(original: bytes, width: int, fmt: str, quality: int) -> bytes:
+    from PIL import Image
+
+    with Image.open(io.BytesIO(original)) as image:
+        image.thumbnail((width, width * 4))
+        if fmt == "jpeg" and image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+        elif fmt == "webp" and image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+
+        out = io.BytesIO()
+        image.save(out, format=fmt.upper(), quality=quality, optimize=True)
+        return out.getvalue()
+
+class ImageCache:
+    """Fetches article images once and serves resized variants from DATA_DIR with an LRU size budget"""
+
+    def __init__(self):
+        self.root = settings.DATA_DIR / "images"
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = settings.IMAGE_CACHE_MAX_MB * 1024 * 1024
+        self.quality = settings.IMAGE_QUALITY
+        self.sources: Dict[str, str] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+        self._usage: int | None = None
+        self._client: "httpx.AsyncClient | None" = None
+        self._inflight = Coalescer()
+        self._evict_lock = asyncio.Lock()
+        self._unsaved: Dict[str, str] = {}
+        self._saving: asyncio.Task | None = None
+
+    def register(self, url: str) -> str:
+        """Remember which upstream URL a hash stands for and return the hash.
+
+        Called while a response is being serialized, so the source file is
+        written later from a worker thread rather than here.
+        """
+        digest = image_hash(url)
+        if digest not in self.sources:
+            self.sources[digest] = url
+            self._unsaved[digest] = url
+            if self._saving is None or self._saving.done():
+                self._saving = asyncio.ensure_future(self._save_sources())
+        return digest
+
+    async def _save_sources(self) -> None:
+        while self._unsaved:
+            batch, self._unsaved = self._unsaved, {}
+            await asyncio.to_thread(self._write_sources, batch)
+
+    def _write_sources(self, batch: Dict[str, str]) -> None:
+        for digest, url in batch.items():
+            source_file = self.root / digest / "source"
+            if not source_file.exists():
+                source_file.parent.mkdir(exist_ok=True)
+                source_file.write_text(url, encoding="utf-8")
+
+    async def source(self, digest: str) -> str | None:
+        if digest not in self.sources:
+            source_file = self.root / digest / "source"
+            try:
+                url = await asyncio.to_thread(source_file.read_text, encoding="utf-8")
+            except FileNotFoundError:
+                return None
+            self.sources[digest] = url
+        return self.sources[digest]
+
+    def proxy_url(self, url: str, base_url: str, width: int = 0) -> str:
+        width = snap_width(width or settings.IMAGE_DEFAULT_WIDTH)
+        return f"{base_url}{settings.API_V1_PREFIX}/images/{self.register(url)}?w={width}"
+
+    async def get(self, digest: str, width: int, fmt: str) -> Path | None:
+        variant = self.root / digest / f"w{width}.{'jpg' if fmt == 'jpeg' else fmt}"
+        try:
+            # Touching it also marks the file as recently used, which keeps
+            # _evict away from it while the response is sent.
+            await asyncio.to_thread(os.utime, variant)
+            self.hits += 1
+            return variant
+        except FileNotFoundError:
+            pass
+
+        url = await self.source(digest)
+        if url is None:
+            return None
+
+        self.misses += 1
+        await self._inflight.run(
+            f"{digest}/{variant.name}",
+            lambda: self._build_variant(digest, url, variant, width, fmt)
+        )
+        return variant
+
+    async def _build_variant(self, digest: str, url: str, variant: Path, width: int, fmt: str) -> None:
+        original = await self._original(digest, url)
+        try:
+            data = await asyncio.to_thread(_resize, original, width, fmt, self.quality)
+        except Exception as e:
+            raise ImageFetchError(f"Could not resize {url}: {e}")
+        await self._write(variant, data)
+
+    async def _original(self, digest: str, url: str) -> bytes:
+        path = self.root / digest / "original"
+        try:
+            return await asyncio.to_thread(self._read_touch, path)
+        except FileNotFoundError:
+            pass
+
+        return await self._inflight.run(f"{digest}/original", lambda: self._download(url, path))
+
+    async def _download(self, url: str, path: Path) -> bytes:
+        import httpx
+
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=settings.IMAGE_FETCH_TIMEOUT,
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
+                headers={"User-Agent": FingerprintGenerator.USER_AGENTS[0]},
+            )
+
+        print(f"  Fetching image: {url}")
+        try:
+            response = await self._client.get(url)
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            raise ImageFetchError(f"Could not fetch {url}: {e}")
+
+        if len(response.content) > MAX_ORIGINAL_BYTES:
+            raise ImageFetchError(f"Image too large: {url}")
+
+        await self._write(path, response.content)
+        return response.content
+
+    @staticmethod
+    def _read_touch(path: Path) -> bytes:
+        data = path.read_bytes()
+        os.utime(path)
+        return data
+
+    @staticmethod
+    def _write_file(path: Path, data: bytes) -> None:
+        path.parent.mkdir(exist_ok=True)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_bytes(data)
+        tmp.replace(path)
+
+    async def _write(self, path: Path, data: bytes) -> None:
+        await asyncio.to_thread(self._write_file, path, data)
+
+        if self._usage is None:
+            self._usage = await asyncio.to_thread(self._scan_usage)
+        else:
+            self._usage += len(data)
+
+        if self._usage > self.max_bytes:
+            await self._evict()
+
+    def _cached_files(self) -> list[tuple[float, int, Path]]:
+        """(mtime, size, path) of every original and variant, skipping files deleted mid-scan"""
+        files = []
+        for p in self.root.glob("*/*"):
+            if p.name == "source" or p.name.endswith(".tmp"):
+                continue
+            try:
+                stat = p.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, p))
+        return files
+
+    def _scan_usage(self) -> int:
+        return sum(size for _, size, _ in self._cached_files())
+
+    async def _evict(self) -> None:
+        async with self._evict_lock:
+            def evict() -> tuple[int, int]:
+                files = sorted(self._cached_files(), key=lambda entry: entry[0])
+                usage = sum(size for _, size, _ in files)
+                target = int(self.max_bytes * 0.9)
+                cutoff = time.time() - EVICT_GRACE
+                removed = 0
+                for mtime, size, path in files:
+                    if usage <= target or mtime > cutoff:
+                        break
+                    try:
+                        if path.stat().st_mtime > cutoff:
+                            continue
+                        path.unlink()
+                        usage -= size
+                        removed += 1
+                    except OSError:
+                        continue
+                return usage, removed
+
+            self._usage, removed = await asyncio.to_thread(evict)
+            self.evicted += removed
+            if removed:
+                print(f"Evicted {removed} cached images, {self._usage // (1024 * 1024)} MB in use")
+
+    async def close(self) -> None:
+        if self._saving:
+            await self._saving
+        if self._client:
+            await self._client.aclose()
+            self._client = None
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evicted": self.evicted,
+            "usage_mb": round((self._usage or 0) / (1024 * 1024), 1),
+            "budget_mb": settings.IMAGE_CACHE_MAX_MB,
+        }
@@ -1,6 +1,7 @@
 from bs4 import BeautifulSoup
+from datetime import datetime
 from typing import List, Optional
-from app.models.article import Article
+from app.models.article import Article, ArticleBody, article_id
 
 class HTMLParser:
     """Parse HTML content to extract articles"""
@@ -86,6 +87,40 @@ class HTMLParser:
 
         return articles
     
+    def parse_article(self, html: str, url: str) -> Optional[ArticleBody]:
+        """Parse the body text, title and author from a story page"""
+        soup = BeautifulSoup(html, 'html.parser')
+        
+        content = soup.select_one(
+            '.story__content, article .story__content, '
+            '[class*="story__content"], .template__main article, article'
+        )
+        if not content:
+            return None
+        
+        paragraphs = [" ".join(p.get_text().split()) for p in content.find_all('p')]
+        body = "\n\n".join(p for p in paragraphs if p)
+        if not body:
+            return None
+        
+        title_el = soup.select_one('.story__title, h1, h2')
+        author_el = soup.select_one(
+            '.story__byline a, .story__byline, [class*="byline"] a, [rel="author"]'
+        )
+        author = author_el.get_text(strip=True) if author_el else None
+        if not author:
+            meta = soup.find('meta', attrs={'name': 'author'})
+            author = meta.get('content') if meta else None
+        
+        return ArticleBody(
+            id=article_id(url),
+            url=url,
+            title=title_el.get_text(strip=True) if title_el else None,
+            author=author or None,
+            body=body,
+            fetched_at=datetime.now().isoformat()
+        )
+    
     def _resolve_image_url(self, article_soup) -> Optional[str]:
         img = article_soup.find('img')
         picture = article_soup.find('picture')
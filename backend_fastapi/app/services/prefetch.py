@@ -0,0 +1,158 @@
+import asyncio
+import time
+from collections import Counter, OrderedDict, deque
+from datetime import date, datetime, timedelta
+from typing import Deque, Dict, List
+from app.config import settings
+from app.services.scraper import ScraperService
+from app.services.tasks import BackgroundWorker
+
+MAX_CLIENTS = 1024
+MAX_STRIDE = 7
+
+def _parse(date_string: str) -> date:
+    return datetime.strptime(date_string, '%Y-%m-%d').date()
+
+class PrefetchPlanner(BackgroundWorker):
+    """Learns how clients move through the archive and scrapes the days they are likely to ask for next"""
+
+    def __init__(self, scraper: ScraperService):
+        self.scraper = scraper
+        self.depth = settings.PREFETCH_DEPTH
+        self.budget = settings.PREFETCH_MAX_PER_HOUR
+        self.history_size = settings.PREFETCH_HISTORY
+
+        self.histories: "OrderedDict[str, Deque[date]]" = OrderedDict()
+        self.global_strides: Deque[int] = deque(maxlen=256)
+        self.queue: asyncio.Queue[str] = asyncio.Queue()
+        self.queued: set[str] = set()
+        self.prefetched: "OrderedDict[str, bool]" = OrderedDict()
+        self._started: Deque[float] = deque()
+
+        self.requests = 0
+        self.warm = 0
+        self.hits = 0
+        self.scraped = 0
+        self.skipped_budget = 0
+        self.skipped_scope = 0
+
+    def observe(self, client: str, date_string: str, warm: bool) -> None:
+        """Record a user-facing request and queue the predicted next days"""
+        self.requests += 1
+        if warm:
+            self.warm += 1
+        if self.prefetched.pop(date_string, None):
+            self.hits += 1
+
+        history = self.histories.pop(client, None) or deque(maxlen=self.history_size)
+        day = _parse(date_string)
+        if history and history[-1] != day:
+            stride = (day - history[-1]).days
+            if abs(stride) <= MAX_STRIDE:
+                self.global_strides.append(stride)
+        if not history or history[-1] != day:
+            history.append(day)
+
+        self.histories[client] = history
+        if len(self.histories) > MAX_CLIENTS:
+            self.histories.popitem(last=False)
+
+        for candidate in self.predict(list(history)):
+            self._enqueue(candidate.strftime('%Y-%m-%d'))
+
+    def predict(self, history: List[date]) -> List[date]:
+        last = history[-1]
+        scores: Dict[date, float] = {}
+
+        def vote(days: int, weight: float) -> None:
+            if days:
+                candidate = last + timedelta(days=days)
+                scores[candidate] = scores.get(candidate, 0.0) + weight
+
+        strides = [(b - a).days for a, b in zip(history, history[1:])]
+        if strides and 0 < abs(strides[-1]) <= MAX_STRIDE:
+            run = 1
+            while run < len(strides) and strides[-run - 1] == strides[-1]:
+                run += 1
+            vote(strides[-1], 2.0 + run)
+            vote(2 * strides[-1], 1.0 + run / 2)
+
+        if any(abs(s) == 7 for s in strides):
+            vote(7, 1.5)
+            vote(-7, 1.0)
+
+        if self.global_strides:
+            total = len(self.global_strides)
+            for stride, count in Counter(self.global_strides).most_common(3):
+                vote(stride, 2.0 * count / total)
+
+        vote(1, 0.5)
+        vote(-1, 0.5)
+
+        seen = set(history)
+        ranked = sorted(scores, key=scores.get, reverse=True)
+        return [
+            d for d in ranked
+            if d not in seen and not self._out_of_scope(d.strftime('%Y-%m-%d'))
+        ][:self.depth]
+
+    def _within_budget(self) -> bool:
+        cutoff = time.monotonic() - 3600
+        while self._started and self._started[0] < cutoff:
+            self._started.popleft()
+        return len(self._started) + len(self.queued) < self.budget
+
+    def _out_of_scope(self, date_string: str) -> bool:
+        """Today and tomorrow, which the rollover scheduler prepares itself"""
+        return date_string in (self.scraper.get_todays_date(), self.scraper.get_tomorrows_date())
+
+    def _enqueue(self, date_string: str) -> None:
+        if self._out_of_scope(date_string):
+            self.skipped_scope += 1
+            return
+        if (
+            date_string in self.queued
+            or date_string in self.prefetched
+            or date_string in self.scraper.cache
+            or date_string in self.scraper.inflight
+        ):
+            return
+        if not self._within_budget():
+            self.skipped_budget += 1
+            return
+        self.queued.add(date_string)
+        self.queue.put_nowait(date_string)
+
+    async def _run(self) -> None:
+        while True:
+            date_string = await self.queue.get()
+            self.queued.discard(date_string)
+            try:
+                if self._out_of_scope(date_string) or await self.scraper.repository.file_exists(date_string):
+                    continue
+                print(f"Prefetching {date_string}")
+                self._started.append(time.monotonic())
+                await self.scraper.scrape_day(date_string)
+                self.scraped += 1
+                self.prefetched[date_string] = True
+                if len(self.prefetched) > MAX_CLIENTS:
+                    self.prefetched.popitem(last=False)
+            except Exception as e:
+                print(f"Error prefetching {date_string}: {e}")
+            finally:
+                self.queue.task_done()
+
+    def stats(self) -> dict:
+        return {
+            "requests": self.requests,
+            "warm_rate": round(self.warm / self.requests, 3) if self.requests else None,
+            "prefetched": self.scraped,
+            "prefetch_hits": self.hits,
+            "hit_rate": round(self.hits / self.requests, 3) if self.requests else None,
+            "precision": round(self.hits / self.scraped, 3) if self.scraped else None,
+            "queued": sorted(self.queued),
+            "budget_per_hour": self.budget,
+            "skipped_budget": self.skipped_budget,
+            "skipped_scope": self.skipped_scope,
+            "tracked_clients": len(self.histories),
+        }
@@ -0,0 +1,139 @@
+import asyncio
+import time
+from typing import Dict, List, Optional
+from urllib.parse import unquote, urlsplit
+from app.config import settings
+
+class Proxy:
+    """A single proxy exit with its health statistics"""
+
+    def __init__(self, url: str):
+        parts = urlsplit(url if "://" in url else f"http://{url}")
+        if not parts.hostname:
+            raise ValueError(f"Invalid proxy URL: {url}")
+
+        port = f":{parts.port}" if parts.port else ""
+        self.server = f"{parts.scheme}://{parts.hostname}{port}"
+        self.username = unquote(parts.username) if parts.username else None
+        self.password = unquote(parts.password) if parts.password else None
+
+        self.successes = 0
+        self.blocks = 0
+        self.failures = 0
+        self.consecutive_blocks = 0
+        self.latency: float | None = None
+        self.cooldown_until = 0.0
+
+    def to_playwright(self) -> Dict[str, str]:
+        config = {"server": self.server}
+        if self.username:
+            config["username"] = self.username
+            config["password"] = self.password or ""
+        return config
+
+    def is_available(self, now: float) -> bool:
+        return now >= self.cooldown_until
+
+    @property
+    def score(self) -> float:
+        """Higher is better: success ratio with a mild penalty for slow exits"""
+        attempts = self.successes + self.blocks + self.failures
+        success_rate = (self.successes + 1) / (attempts + 2)
+        latency_penalty = 1.0 / (1.0 + (self.latency or 0.0) / 10.0)
+        return success_rate * latency_penalty
+
+    def stats(self) -> dict:
+        return {
+            "server": self.server,
+            "successes": self.successes,
+            "blocks": self.blocks,
+            "failures": self.failures,
+            "latency": round(self.latency, 3) if self.latency is not None else None,
+            "score": round(self.score, 3),
+            "cooling_down": max(0.0, round(self.cooldown_until - time.monotonic(), 1)),
+        }
+
+class ProxyPool:
+    """Pool of proxy exits with health scoring, cool-down and sticky assignment"""
+
+    def __init__(self, urls: List[str]):
+        self.proxies = [Proxy(url) for url in urls]
+        self.base_cooldown = settings.PROXY_COOLDOWN
+        self.max_cooldown = settings.PROXY_MAX_COOLDOWN
+        self._sticky: Dict[str, Proxy] = {}
+
+    @classmethod
+    def from_settings(cls) -> "ProxyPool":
+        urls = []
+        if settings.PROXY_URLS:
+            urls.extend(u.strip() for u in settings.PROXY_URLS.split(",") if u.strip())
+        if settings.PROXY_URL and settings.PROXY_URL not in urls:
+            urls.append(settings.PROXY_URL)
+        return cls(urls)
+
+    def __len__(self) -> int:
+        return len(self.proxies)
+
+    async def acquire(self, session_key: Optional[str] = None) -> Proxy | None:
+        """Return the proxy for a session, waiting if every exit is cooling down"""
+        if not self.proxies:
+            return None
+
+        while True:
+            now = time.monotonic()
+
+            sticky = self._sticky.get(session_key) if session_key else None
+            if sticky and sticky.is_available(now):
+                return sticky
+
+            available = [p for p in self.proxies if p.is_available(now)]
+            if available:
+                proxy = max(available, key=lambda p: p.score)
+                if session_key:
+                    self._sticky[session_key] = proxy
+                return proxy
+
+            wait = min(p.cooldown_until for p in self.proxies) - now
+            print(f"  All proxies cooling down, waiting {wait:.1f}s")
+            await asyncio.sleep(wait)
+
+    def release(self, session_key: str) -> None:
+        self._sticky.pop(session_key, None)
+
+    def report_success(self, proxy: Proxy | None, latency: float) -> None:
+        if proxy is None:
+            return
+        proxy.successes += 1
+        proxy.consecutive_blocks = 0
+        proxy.latency = latency if proxy.latency is None else 0.8 * proxy.latency + 0.2 * latency
+
+    def report_blocked(self, proxy: Proxy | None) -> None:
+        """Cool a blocked exit down, unless it is the only one left to use.
+
+        Benching the last available exit would make callers sleep out the
+        cool-down inside user requests; the rate limiter backs off instead.
+        """
+        if proxy is None:
+            return
+        proxy.blocks += 1
+        proxy.consecutive_blocks += 1
+        
+        now = time.monotonic()
+        if not any(p.is_available(now) for p in self.proxies if p is not proxy):
+            print(f"  Proxy {proxy.server} blocked, but it is the only exit available")
+            return
+        
+        cooldown = min(
+            self.base_cooldown * 2 ** (proxy.consecutive_blocks - 1),
+            self.max_cooldown
+        )
+        proxy.cooldown_until = now + cooldown
+        print(f"  Proxy {proxy.server} blocked, cooling down for {cooldown:.0f}s")
+
+    def report_failure(self, proxy: Proxy | None) -> None:
+        if proxy is None:
+            return
+        proxy.failures += 1
+
+    def stats(self) -> List[dict]:
+        return [p.stats() for p in self.proxies]
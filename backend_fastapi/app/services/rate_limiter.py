@@ -0,0 +1,68 @@
+import asyncio
+import time
+from typing import Dict
+from urllib.parse import urlsplit
+from app.config import settings
+
+class TokenBucket:
+    """Token bucket whose refill rate grows on success and halves on blocks"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self) -> None:
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+class AdaptiveRateLimiter:
+    """Per-host rate limiter using additive increase / multiplicative decrease"""
+
+    def __init__(
+        self,
+        initial_rate: float | None = None,
+        max_rate: float | None = None,
+        burst: int | None = None
+    ):
+        self.initial_rate = initial_rate or settings.RATE_LIMIT_INITIAL
+        self.min_rate = settings.RATE_LIMIT_MIN
+        self.max_rate = max_rate or settings.RATE_LIMIT_MAX
+        self.burst = burst or settings.RATE_LIMIT_BURST
+        self.increase = settings.RATE_LIMIT_INCREASE
+        self.backoff = settings.RATE_LIMIT_BACKOFF
+        self.buckets: Dict[str, TokenBucket] = {}
+
+    def _bucket(self, url: str) -> TokenBucket:
+        host = urlsplit(url).netloc
+        if host not in self.buckets:
+            self.buckets[host] = TokenBucket(self.initial_rate, self.burst)
+        return self.buckets[host]
+
+    async def acquire(self, url: str) -> None:
+        await self._bucket(url).acquire()
+
+    def on_success(self, url: str) -> None:
+        bucket = self._bucket(url)
+        bucket.rate = min(self.max_rate, bucket.rate + self.increase)
+
+    def on_blocked(self, url: str) -> None:
+        bucket = self._bucket(url)
+        bucket.rate = max(self.min_rate, bucket.rate * self.backoff)
+        bucket.tokens = min(bucket.tokens, 0.0)
+        print(f"  Rate for {urlsplit(url).netloc} lowered to {bucket.rate:.3f} req/s")
+
+    def stats(self) -> Dict[str, float]:
+        return {host: round(bucket.rate, 3) for host, bucket in self.buckets.items()}
@@ -0,0 +1,148 @@
+import asyncio
+from datetime import datetime, time, timedelta
+from typing import TYPE_CHECKING
+from app.config import settings
+from app.models.compact import CompactDay
+from app.services.archive import ArchiveService, PKT, DAILY_SECTIONS, SECTIONS
+from app.services.tasks import BackgroundWorker
+
+if TYPE_CHECKING:
+    from app.services.scraper import ScraperService
+
+class TodaySnapshot:
+    """A day's archive serialized once, ready to be written straight to clients"""
+
+    __slots__ = ("date", "compact", "body", "complete")
+
+    def __init__(self, compact: CompactDay, complete: bool):
+        self.date = compact.date
+        self.compact = compact
+        self.body = compact.to_json()
+        self.complete = complete
+
+class RolloverScheduler(BackgroundWorker):
+    """Prepares tomorrow ahead of midnight PKT and swaps it in as "today" on the dot"""
+
+    def __init__(self, archive: ArchiveService):
+        self.archive = archive
+        # Only the full app scrapes; get_archive_service hands it the ScraperService.
+        self.scraper: "ScraperService | None" = None if settings.READ_ONLY else archive
+        self.lead = settings.ROLLOVER_LEAD_MINUTES * 60
+        self.retry_interval = settings.ROLLOVER_RETRY_INTERVAL
+        self.current: TodaySnapshot | None = None
+        self.pending: TodaySnapshot | None = None
+        self.rollovers = 0
+
+    def get(self, date_string: str) -> TodaySnapshot | None:
+        """Snapshot for date_string, promoting the pending one if the clock got there first"""
+        current = self.current
+        if current and current.date == date_string:
+            return current
+
+        pending = self.pending
+        if pending and pending.date == date_string:
+            self._swap()
+            return pending
+        return None
+
+    def _swap(self) -> None:
+        if self.pending:
+            self.current, self.pending = self.pending, None
+            self.rollovers += 1
+            print(f"Rolled over to {self.current.date}")
+
+    @staticmethod
+    def is_complete(compact: CompactDay) -> bool:
+        """Every section was attempted and every daily section has articles.
+
+        scrape_day writes every key even when a section was blocked, so the
+        keys alone say nothing about whether the day is usable.
+        """
+        return (
+            all(section in compact.sections for section in SECTIONS)
+            and all(len(compact.sections[section]) for section in DAILY_SECTIONS)
+        )
+
+    async def build_snapshot(self, date_string: str) -> TodaySnapshot | None:
+        if not self.scraper:
+            # The scraping instance may have rewritten the file since we cached it.
+            self.archive.cache.pop(date_string, None)
+        compact = await self.archive.load_compact(date_string)
+
+        if self.scraper:
+            if compact is None:
+                await self.scraper.scrape_day(date_string)
+            elif not self.is_complete(compact):
+                await self.scraper.fill_missing_sections(compact.to_archive(), DAILY_SECTIONS)
+            compact = await self.archive.load_compact(date_string)
+
+        if compact is None:
+            return None
+        return TodaySnapshot(compact, self.is_complete(compact))
+
+    async def _run(self) -> None:
+        try:
+            self.current = await self.build_snapshot(self.archive.get_todays_date())
+        except Exception as e:
+            print(f"Error preparing today's snapshot: {e}")
+
+        while True:
+            now = datetime.now(PKT)
+            midnight = PKT.localize(datetime.combine(now.date() + timedelta(days=1), time.min))
+
+            prepare_at = midnight - timedelta(seconds=self.lead)
+            if now < prepare_at:
+                await asyncio.sleep((prepare_at - now).total_seconds())
+
+            await self._prepare(self.archive.get_tomorrows_date(), midnight)
+
+            # Overshoot slightly so the next iteration computes the following midnight;
+            # requests in the gap are already served from pending via get().
+            remaining = (midnight - datetime.now(PKT)).total_seconds()
+            await asyncio.sleep(max(remaining, 0) + 1)
+
+            self._swap()
+            await self._cleanup()
+
+    async def _prepare(self, date_string: str, deadline: datetime) -> None:
+        print(f"Preparing rollover to {date_string}")
+        while True:
+            try:
+                snapshot = await self.build_snapshot(date_string)
+                if snapshot:
+                    self.pending = snapshot
+                    if snapshot.complete:
+                        print(f"Rollover to {date_string} ready")
+                        return
+            except Exception as e:
+                print(f"Error preparing {date_string}: {e}")
+
+            remaining = (deadline - datetime.now(PKT)).total_seconds()
+            if remaining <= self.retry_interval:
+                print(f"⚠ Rollover to {date_string} not complete before midnight")
+                return
+            await asyncio.sleep(self.retry_interval)
+
+    async def _cleanup(self) -> None:
+        """Drop days before today from memory; only the scraping instance deletes their files"""
+        if not self.current:
+            return
+        try:
+            if self.scraper:
+                deleted = await self.archive.repository.delete_old_files(self.current.date)
+                if deleted > 0:
+                    print(f"Deleted {deleted} old files")
+            for date_string in [d for d in self.archive.cache if d < self.current.date]:
+                del self.archive.cache[date_string]
+        except Exception as e:
+            print(f"Error cleaning up after rollover: {e}")
+
+    def status(self) -> dict:
+        return {
+            "today": self.current.date if self.current else None,
+            "today_complete": self.current.complete if self.current else None,
+            "pending": self.pending.date if self.pending else None,
+            "pending_complete": self.pending.complete if self.pending else None,
+            "rollovers": self.rollovers,
+            "running": self.running,
+        }
@@ -1,51 +1,78 @@
 import asyncio
 import random
-import pytz
-from datetime import datetime, timedelta
-from typing import Dict
-from app.services.browser import BrowserManager
-from app.services.parser import HTMLParser
+import time
+from datetime import datetime
+from typing import TYPE_CHECKING, Callable, List
+from app.services.archive import ArchiveService, SECTIONS
+from app.services.rate_limiter import AdaptiveRateLimiter
+from app.services.tasks import Coalescer
 from app.repositories.archive_repo import ArchiveRepository
 from app.models.archive import DayArchive
+from app.models.article import Article
 from app.config import settings
 
-PKT = pytz.timezone("Asia/Karachi")
+if TYPE_CHECKING:
+    from app.services.browser import BrowserManager
+    from app.services.parser import HTMLParser
 
-class ScraperService:
+class PageBlockedError(Exception):
+    """Raised when the target answers with 403 Forbidden"""
+
+class ScraperService(ArchiveService):
     def __init__(
         self,
-        browser_manager: BrowserManager,
-        parser: HTMLParser,
-        repository: ArchiveRepository
+        browser_manager: "BrowserManager",
+        parser: "HTMLParser",
+        repository: ArchiveRepository,
+        rate_limiter: AdaptiveRateLimiter | None = None
     ):
+        super().__init__(repository)
         self.browser = browser_manager
         self.parser = parser
-        self.repository = repository
+        self.rate_limiter = rate_limiter or AdaptiveRateLimiter()
         self.base_url = settings.BASE_URL
-        self.cache: Dict[str, DayArchive] = {}
+        self.inflight = Coalescer()
+        self.on_saved: List[Callable[[DayArchive], None]] = []
     
-    def get_todays_date(self) -> str:
-        now = datetime.now(PKT)
-        past = now.replace(year=now.year - 12)
-        return past.strftime('%Y-%m-%d')
+    async def fetch_page(
+        self,
+        url: str,
+        retry_count: int = 0,
+        session_key: str | None = None,
+        settle: bool = True,
+        rate_limiter: AdaptiveRateLimiter | None = None
+    ) -> str:
+        """Load url in a fresh stealth context and return its HTML.
 
-    def get_tomorrows_date(self) -> str:
-        today_str = self.get_todays_date()
-        today_dt = datetime.strptime(today_str, '%Y-%m-%d')
-        tomorrow_dt = today_dt + timedelta(days=1)        
-        return tomorrow_dt.strftime('%Y-%m-%d')
-    
-    async def fetch_page(self, url: str, retry_count: int = 0) -> str:
+        settle waits for and scrolls through lazily rendered listings; story
+        pages are server-rendered and skip it. rate_limiter overrides the
+        shared listing limiter, so other page kinds get buckets of their own.
+        """
         max_retries = settings.MAX_RETRIES
+        proxy_pool = self.browser.proxy_pool
+        limiter = rate_limiter or self.rate_limiter
         
-        context = await self.browser.create_stealth_context()
-        page = await context.new_page()
+        proxy = await proxy_pool.acquire(session_key)
+        await limiter.acquire(url)
+        
+        context = None
+        try:
+            context = await self.browser.create_stealth_context(proxy)
+            page = await context.new_page()
+        except Exception as e:
+            print(f"  ✗ Browser error: {e}")
+            if context:
+                await self._close_quietly(context)
+            await self.browser.recover()
+            
+            if retry_count < max_retries:
+                return await self.fetch_page(url, retry_count + 1, session_key, settle, rate_limiter)
+            raise
 
         print(f"  Fetching: {url} (attempt {retry_count + 1}/{max_retries + 1})")
         
         try:
-            await asyncio.sleep(random.uniform(0.5, 1.5))
-            
+            started = time.monotonic()
             response = await page.goto(
                 url, 
                 wait_until="domcontentloaded",
@@ -56,75 +83,99 @@ class ScraperService:
             print(f"  Response status: {status}")
             
             if response and response.status == 403:
-                print(f"  Got 403, retrying with fresh context...")
-                await page.close()
-                await context.close()
-                
-                if retry_count < max_retries:
-                    await asyncio.sleep(random.uniform(3, 5))
-                    return await self.fetch_page(url, retry_count + 1)
-                else:
-                    raise Exception(f"Failed after {max_retries + 1} attempts: 403 Forbidden")
-            
-            await asyncio.sleep(random.uniform(1.5, 2.5))
+                raise PageBlockedError(url)
+            latency = time.monotonic() - started
             
-            try:
-                await page.wait_for_selector(
-                    'article, .story, .box, [class*="story"]',
-                    timeout=10000
-                )
-                print(f"  ✓ Content loaded successfully")
-            except Exception as wait_err:
-                print(f"  ⚠ Timeout waiting for content: {wait_err}")
-            
-            await page.evaluate("""
-                async () => {
-                    await new Promise((resolve) => {
-                        let totalHeight = 0;
-                        const distance = 100;
-                        const timer = setInterval(() => {
-                            const scrollHeight = document.body.scrollHeight;
-                            window.scrollBy(0, distance);
-                            totalHeight += distance;
-
-                            if(totalHeight >= scrollHeight){
-                                clearInterval(timer);
-                                resolve();
-                            }
-                        }, 100);
-                    });
-                }
-            """)
-            
-            await asyncio.sleep(random.uniform(1, 2))
+            if settle:
+                await self._settle(page)
             
             html = await page.content()
             
             print(f"  HTML length: {len(html)} characters")
+            proxy_pool.report_success(proxy, latency)
+            limiter.on_success(url)
+            
+        except PageBlockedError:
+            print(f"  Got 403, retrying with fresh context...")
+            proxy_pool.report_blocked(proxy)
+            limiter.on_blocked(url)
+            await page.close()
+            await context.close()
             
+            if retry_count < max_retries:
+                return await self.fetch_page(url, retry_count + 1, session_key, settle, rate_limiter)
+            raise Exception(f"Failed after {max_retries + 1} attempts: 403 Forbidden")
         except Exception as e:
             print(f"  ✗ Error: {e}")
+            proxy_pool.report_failure(proxy)
             await page.close()
             await context.close()
             
             if retry_count < max_retries:
-                await asyncio.sleep(random.uniform(3, 5))
-                return await self.fetch_page(url, retry_count + 1)
+                return await self.fetch_page(url, retry_count + 1, session_key, settle, rate_limiter)
             raise
         
         await page.close()
         await context.close()
         return html
     
-    async def scrape_day(self, date_string: str) -> DayArchive:
-            
-        sections = [
-            'front-page', 'national', 'business', 'international',
-            'sport', 'editorial', 'back-page', 'other-voices',
-            'letters', 'books-authors', 'business-finance',
-            'young-world', 'sunday-magzine', 'icon'
-        ]
+    async def _settle(self, page) -> None:
+        await asyncio.sleep(random.uniform(1.5, 2.5))
         
+        try:
+            await page.wait_for_selector(
+                'article, .story, .box, [class*="story"]',
+                timeout=10000
+            )
+            print(f"  ✓ Content loaded successfully")
+        except Exception as wait_err:
+            print(f"  ⚠ Timeout waiting for content: {wait_err}")
+        
+        await page.evaluate("""
+            async () => {
+                await new Promise((resolve) => {
+                    let totalHeight = 0;
+                    const distance = 100;
+                    const timer = setInterval(() => {
+                        const scrollHeight = document.body.scrollHeight;
+                        window.scrollBy(0, distance);
+                        totalHeight += distance;
+
+                        if(totalHeight >= scrollHeight){
+                            clearInterval(timer);
+                            resolve();
+                        }
+                    }, 100);
+                });
+            }
+        """)
+        
+        await asyncio.sleep(random.uniform(1, 2))
+    
+    async def _close_quietly(self, context) -> None:
+        try:
+            await context.close()
+        except Exception:
+            pass
+    
+    async def scrape_section(self, date_string: str, section: str) -> List[Article]:
+        print(f"Scraping {section} for {date_string}...")
+        try:
+            url = f"{self.base_url}/{section}/{date_string}"
+            html = await self.fetch_page(url, session_key=date_string)
+            articles = self.parser.parse_section(html, section, date_string)
+            print(f"   Found {len(articles)} articles in {section}")
+            return articles
+            
+        except Exception as err:
+            print(f"✗ Failed to scrape {section}: {err}")
+            return []
+    
+    async def scrape_day(self, date_string: str) -> DayArchive:
+        """Scrape a day, joining any scrape of the same day that is already running"""
+        return await self.inflight.run(date_string, lambda: self._scrape_day(date_string))
+    
+    async def _scrape_day(self, date_string: str) -> DayArchive:
         day_archive = DayArchive(
             date=date_string,
             sections={},
@@ -133,45 +184,40 @@ class ScraperService:
 
         await self.browser.init_browser()
 
-        for section in sections:
-            print(f"Scraping {section} for {date_string}...")
-            try:
-                url = f"{self.base_url}/{section}/{date_string}"
-                html = await self.fetch_page(url)
-                articles = self.parser.parse_section(html, section, date_string)
-
-                day_archive.sections[section] = articles
-                print(f"   Found {len(articles)} articles in {section}")
-
-                await asyncio.sleep(random.uniform(2, 4))
-                
-            except Exception as err:
-                print(f"✗ Failed to scrape {section}: {err}")
-                day_archive.sections[section] = []
+        for section in SECTIONS:
+            day_archive.sections[section] = await self.scrape_section(date_string, section)
 
+        self.browser.proxy_pool.release(date_string)
         await self.repository.save(day_archive)
-        self.cache[date_string] = day_archive
+        self.remember(day_archive)
+        self._notify_saved(day_archive)
 
         return day_archive
     
-    async def load_archive(self, date_string: str) -> DayArchive | None:
-        if date_string in self.cache:
-            return self.cache[date_string]
+    async def fill_missing_sections(
+        self,
+        archive: DayArchive,
+        sections: List[str] = SECTIONS
+    ) -> DayArchive:
+        """Re-scrape sections that are absent or came back empty"""
+        missing = [s for s in sections if not archive.sections.get(s)]
+        if not missing:
+            return archive
         
-        archive = await self.repository.load(date_string)
-        if archive:
-            self.cache[date_string] = archive
-        return archive
-    
-    async def ensure_tomorrow_exists(self):
-        tomorrow = self.get_tomorrows_date()
+        print(f"Re-scraping {len(missing)} empty sections for {archive.date}")
+        for section in missing:
+            articles = await self.scrape_section(archive.date, section)
+            if articles or section not in archive.sections:
+                archive.sections[section] = articles
         
-        if await self.repository.file_exists(tomorrow):
-            print(f"Tomorrow's data already exists: {tomorrow}")
-            return
+        self.browser.proxy_pool.release(archive.date)
+        archive.cached_at = datetime.now().isoformat()
+        await self.repository.save(archive)
+        self.remember(archive)
+        self._notify_saved(archive)
         
-        print(f"Precomputing tomorrow's data: {tomorrow}")
-        try:
-            await self.scrape_day(tomorrow)
-        except Exception as e:
-            print(f"Error precomputing tomorrow: {e}")
\ No newline at end of file
+        return archive
+    
+    def _notify_saved(self, archive: DayArchive) -> None:
+        for callback in self.on_saved:
+            callback(archive)
\ No newline at end of file
@@ -0,0 +1,62 @@
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+class BackgroundWorker(ABC):
+    """Base for services that own one long-running _run() loop"""
+
+    _task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    @abstractmethod
+    async def _run(self) -> None:
+        ...
+
+class Coalescer:
+    """Runs at most one task per key; concurrent callers for a key share its result.
+
+    The task is shielded, so a caller that gives up (e.g. a client
+    disconnecting) does not cancel the work for everyone else.
+    """
+
+    def __init__(self):
+        self.inflight: Dict[Hashable, asyncio.Future] = {}
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.inflight
+
+    def __len__(self) -> int:
+        return len(self.inflight)
+
+    async def run(self, key: Hashable, factory: Callable[[], Awaitable[T]]) -> T:
+        task = self.inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self.inflight[key] = task
+            task.add_done_callback(lambda done: self._finished(key, done))
+        return await asyncio.shield(task)
+
+    def _finished(self, key: Hashable, task: asyncio.Future) -> None:
+        self.inflight.pop(key, None)
+        # Every caller may have been cancelled; retrieve the error so asyncio
+        # does not log it as never retrieved.
+        if not task.cancelled():
+            task.exception()
@@ -0,0 +1,95 @@
+import asyncio
+import os
+from pathlib import Path
+from typing import Dict, List
+from app.config import settings
+from app.services.browser import BrowserManager
+from app.services.tasks import BackgroundWorker
+
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+PROC = Path("/proc")
+
+def process_rss(pid: int) -> int:
+    """Resident set size of a single process in bytes, 0 if unavailable"""
+    try:
+        fields = (PROC / str(pid) / "statm").read_text().split()
+        return int(fields[1]) * PAGE_SIZE
+    except (OSError, IndexError, ValueError):
+        return 0
+
+def descendant_pids(root_pid: int) -> List[int]:
+    """All processes spawned (directly or not) by root_pid, read from /proc"""
+    children: Dict[int, List[int]] = {}
+    for stat_path in PROC.glob("[0-9]*/stat"):
+        try:
+            stat = stat_path.read_text()
+            ppid = int(stat[stat.rindex(")") + 2:].split()[1])
+            children.setdefault(ppid, []).append(int(stat_path.parent.name))
+        except (OSError, ValueError, IndexError):
+            continue
+
+    pids, stack = [], [root_pid]
+    while stack:
+        for child in children.get(stack.pop(), []):
+            pids.append(child)
+            stack.append(child)
+    return pids
+
+def browser_rss() -> int:
+    """Combined RSS of the Playwright driver and Chromium processes"""
+    return sum(process_rss(pid) for pid in descendant_pids(os.getpid()))
+
+class BrowserWatchdog(BackgroundWorker):
+    """Periodically checks browser connectivity and memory, recycling as needed"""
+
+    def __init__(self, browser_manager: BrowserManager):
+        self.browser = browser_manager
+        self.interval = settings.WATCHDOG_INTERVAL
+        self.max_rss = settings.BROWSER_MAX_RSS_MB * 1024 * 1024
+        self.last_rss = 0
+        self.peak_rss = 0
+        self.checks = 0
+
+    def start(self) -> None:
+        if self.interval > 0:
+            super().start()
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.check()
+            except Exception as e:
+                print(f"Watchdog error: {e}")
+
+    async def check(self) -> None:
+        self.checks += 1
+
+        if await self.browser.recover():
+            return
+
+        self.last_rss = await asyncio.to_thread(browser_rss)
+        self.peak_rss = max(self.peak_rss, self.last_rss)
+
+        if self.browser.browser and self.max_rss and self.last_rss > self.max_rss:
+            self.browser.request_recycle(
+                f"RSS {self.last_rss // (1024 * 1024)} MB above {settings.BROWSER_MAX_RSS_MB} MB"
+            )
+
+        await self.browser.recycle_if_idle()
+
+    def health(self) -> dict:
+        return {
+            "browser": self.browser.health(),
+            "memory": {
+                "browser_rss_mb": round(self.last_rss / (1024 * 1024), 1),
+                "browser_peak_rss_mb": round(self.peak_rss / (1024 * 1024), 1),
+                "app_rss_mb": round(process_rss(os.getpid()) / (1024 * 1024), 1),
+                "limit_mb": settings.BROWSER_MAX_RSS_MB,
+            },
+            "watchdog": {
+                "running": self.running,
+                "interval": self.interval,
+                "checks": self.checks,
+            },
+        }
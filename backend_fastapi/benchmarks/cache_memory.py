@@ -0,0 +1,50 @@
+"""Bytes per cached day for full pydantic DayArchive objects vs CompactDay.
+
+Every copy is parsed from JSON separately, as the cache would after reading
+files from disk, so no strings are shared between copies by accident.
+
+    cd backend_fastapi && python -m benchmarks.cache_memory [path/to/day.json]
+"""
+import gc
+import sys
+import tracemalloc
+from pathlib import Path
+from app.models.archive import DayArchive
+from app.models.compact import CompactDay
+
+COPIES = 50
+DEFAULT_SOURCE = Path("fallback_data/fallback.json")
+
+def measure(raw: str, build) -> int:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = [build(raw) for _ in range(COPIES)]
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return (after - before) // COPIES
+
+def main() -> int:
+    source = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SOURCE
+    raw = source.read_text(encoding="utf-8")
+
+    archive = DayArchive.model_validate_json(raw)
+    compact = CompactDay.from_archive(archive)
+    if compact.to_json() != archive.model_dump_json().encode("utf-8"):
+        print("✗ CompactDay does not round-trip to the same JSON")
+        return 1
+
+    full = measure(raw, DayArchive.model_validate_json)
+    lean = measure(raw, lambda r: CompactDay.from_archive(DayArchive.model_validate_json(r)))
+
+    articles = compact.article_count()
+    print(f"source: {source} ({articles} articles, {len(raw.encode('utf-8'))} bytes on disk)")
+    print(f"{'DayArchive':<12}{full:>10} bytes/day{full // max(articles, 1):>8} bytes/article")
+    print(f"{'CompactDay':<12}{lean:>10} bytes/day{lean // max(articles, 1):>8} bytes/article")
+    print(f"\n{full / lean:.1f}x more days fit in the same memory")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
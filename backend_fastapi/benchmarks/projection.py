@@ -0,0 +1,43 @@
+"""Payload size and serialization time for projected archive responses.
+
+    cd backend_fastapi && python -m benchmarks.projection [path/to/day.json]
+"""
+import sys
+import timeit
+from pathlib import Path
+from app.models.archive import DayArchive
+from app.models.compact import ARTICLE_FIELDS, CompactDay
+
+DEFAULT_SOURCE = Path("fallback_data/fallback.json")
+REPEAT = 200
+
+CASES = [
+    ("full (model_dump_json)", None, None, None),
+    ("full (compact, uncached)", None, None, "uncached"),
+    ("full (compact)", None, None, ()),
+    ("2 sections", ["front-page", "national"], None, ()),
+    ("titles only", None, ["title"], ()),
+    ("2 sections, title+url", ["front-page", "national"], ["title", "url"], ()),
+]
+
+def main() -> int:
+    source = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SOURCE
+    archive = DayArchive.model_validate_json(source.read_text(encoding="utf-8"))
+    compact = CompactDay.from_archive(archive)
+
+    print(f"{'case':<28}{'bytes':>10}{'µs/response':>14}")
+    for name, sections, fields, mode in CASES:
+        if mode is None:
+            render = lambda: archive.model_dump_json().encode("utf-8")
+        elif mode == "uncached":
+            # Every field listed explicitly bypasses the cached full body.
+            render = lambda: compact.to_json(fields=ARTICLE_FIELDS)
+        else:
+            render = lambda s=sections, f=fields: compact.to_json(s, f)
+        size = len(render())
+        seconds = timeit.timeit(render, number=REPEAT) / REPEAT
+        print(f"{name:<28}{size:>10}{seconds * 1e6:>14.1f}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
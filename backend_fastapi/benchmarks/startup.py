@@ -0,0 +1,73 @@
+"""Compare startup time and memory of the full and read-only serving modes.
+
+Each mode is measured in a fresh interpreter so that import caching in one run
+cannot flatter the other. Exits non-zero if the read-only app pulls in the
+scraping stack.
+
+    cd backend_fastapi && python -m benchmarks.startup
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+HEAVY_MODULES = ["playwright", "bs4", "lxml"]
+RUNS = 5
+
+PROBE = f"""
+import json, sys, time
+from fastapi.testclient import TestClient
+start = time.perf_counter()
+import app.main
+elapsed = time.perf_counter() - start
+with TestClient(app.main.app) as client:
+    client.get("/")
+rss_kb = next(
+    int(line.split()[1]) for line in open("/proc/self/status")
+    if line.startswith("VmRSS:")
+)
+print(json.dumps({{
+    "startup_s": elapsed,
+    "rss_mb": rss_kb / 1024,
+    "heavy": [m for m in {HEAVY_MODULES!r} if m in sys.modules],
+}}))
+"""
+
+def measure(read_only: bool) -> dict:
+    env = dict(os.environ, READ_ONLY=str(read_only).lower())
+    env.setdefault("TAIMOUR_API_KEY", "benchmark")
+
+    samples = []
+    for _ in range(RUNS):
+        out = subprocess.run(
+            [sys.executable, "-c", PROBE],
+            env=env, capture_output=True, text=True, check=True
+        ).stdout
+        samples.append(json.loads(out.strip().splitlines()[-1]))
+
+    return {
+        "startup_s": statistics.median(s["startup_s"] for s in samples),
+        "rss_mb": statistics.median(s["rss_mb"] for s in samples),
+        "heavy": samples[0]["heavy"],
+    }
+
+def main() -> int:
+    full = measure(read_only=False)
+    lean = measure(read_only=True)
+
+    print(f"{'mode':<10}{'startup (s)':>14}{'RSS (MB)':>12}  heavy imports")
+    for name, result in (("full", full), ("read-only", lean)):
+        heavy = ", ".join(result["heavy"]) or "-"
+        print(f"{name:<10}{result['startup_s']:>14.3f}{result['rss_mb']:>12.1f}  {heavy}")
+
+    print(f"\nread-only startup: {lean['startup_s'] / full['startup_s']:.0%} of full, "
+          f"RSS: {lean['rss_mb'] / full['rss_mb']:.0%} of full")
+
+    if lean["heavy"]:
+        print(f"✗ read-only mode imported {', '.join(lean['heavy'])}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
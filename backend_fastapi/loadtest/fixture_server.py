@@ -0,0 +1,149 @@
+"""Local stand-in for dawn.com's /newspaper/{section}/{date} pages.
+
+Pages come from recorded HTML in RECORDINGS_DIR ({section}.html or
+{section}/{date}.html) and otherwise are rendered from an archive JSON file,
+so the scraper and parser run against realistic markup without touching the
+real site or the proxy budget.
+
+    cd backend_fastapi
+    python -m loadtest.fixture_server --port 8800 --latency 0.3 --forbidden-rate 0.05
+    BASE_URL=http://127.0.0.1:8800/newspaper uvicorn app.main:app
+"""
+import argparse
+import asyncio
+import html
+import json
+import random
+from pathlib import Path
+from fastapi import FastAPI
+from fastapi.responses import HTMLResponse
+
+DEFAULT_SOURCE = Path("fallback_data/fallback.json")
+DEFAULT_RECORDINGS = Path(__file__).parent / "recordings"
+SYNTHETIC_STORIES = 8
+
+class FixtureConfig:
+    def __init__(
+        self,
+        latency: float = 0.2,
+        jitter: float = 0.1,
+        forbidden_rate: float = 0.0,
+        lazy_ms: int = 500,
+        source: Path = DEFAULT_SOURCE,
+        recordings: Path = DEFAULT_RECORDINGS,
+        seed: int | None = None,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.forbidden_rate = forbidden_rate
+        self.lazy_ms = lazy_ms
+        self.source = source
+        self.recordings = recordings
+        self.random = random.Random(seed)
+
+def _render_story(article: dict) -> str:
+    image = ""
+    if article.get("imageUrl"):
+        image = (
+            '<figure class="media"><img src="data:image/gif;base64,R0lGODlhAQABAAAAACw=" '
+            f'data-src="{html.escape(article["imageUrl"])}" alt=""></figure>'
+        )
+    return (
+        '<article class="story box">'
+        f'{image}'
+        f'<h2 class="story__title"><a class="story__link" href="{html.escape(article["url"])}">'
+        f'{html.escape(article["title"])}</a></h2>'
+        f'<div class="story__excerpt">{html.escape(article["summary"])}</div>'
+        '</article>'
+    )
+
+def _synthetic_articles(section: str, date: str) -> list[dict]:
+    return [
+        {
+            "title": f"{section.replace('-', ' ').title()} story {n} for {date}",
+            "url": f"/news/{900000 + n}/{section}-story-{n}",
+            "summary": f"Synthetic summary {n} for the {section} section on {date}.",
+            "imageUrl": None,
+        }
+        for n in range(1, SYNTHETIC_STORIES + 1)
+    ]
+
+def _render_page(stories: str, lazy_ms: int) -> str:
+    if lazy_ms <= 0:
+        body = f'<div class="story-list">{stories}</div>'
+    else:
+        # Stories arrive after load, like dawn.com's lazily rendered listings.
+        body = (
+            '<div class="story-list" id="stories"></div>'
+            f'<script>setTimeout(function () {{'
+            f'document.getElementById("stories").innerHTML = {json.dumps(stories)};'
+            f'}}, {lazy_ms});</script>'
+        )
+    return (
+        '<!DOCTYPE html><html><head><meta charset="utf-8"><title>DAWN.COM</title></head>'
+        f'<body style="min-height:3000px">{body}</body></html>'
+    )
+
+def create_app(config: FixtureConfig) -> FastAPI:
+    app = FastAPI(title="dawn.com fixture")
+    archive = json.loads(config.source.read_text(encoding="utf-8")) if config.source.exists() else {}
+    sections = archive.get("sections", {})
+    app.state.stats = {"pages": 0, "forbidden": 0}
+
+    def recorded(section: str, date: str) -> str | None:
+        for path in (config.recordings / section / f"{date}.html", config.recordings / f"{section}.html"):
+            if path.exists():
+                return path.read_text(encoding="utf-8")
+        return None
+
+    @app.get("/newspaper/{section}/{date}", response_class=HTMLResponse)
+    async def newspaper(section: str, date: str):
+        delay = max(0.0, config.random.gauss(config.latency, config.jitter))
+        await asyncio.sleep(delay)
+
+        if config.random.random() < config.forbidden_rate:
+            app.state.stats["forbidden"] += 1
+            return HTMLResponse("<html><body>Access denied</body></html>", status_code=403)
+
+        app.state.stats["pages"] += 1
+        page = recorded(section, date)
+        if page is None:
+            articles = sections.get(section) or _synthetic_articles(section, date)
+            stories = "".join(_render_story(a) for a in articles)
+            page = _render_page(stories, config.lazy_ms)
+        return HTMLResponse(page)
+
+    @app.get("/stats")
+    async def stats():
+        return app.state.stats
+
+    return app
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8800)
+    parser.add_argument("--latency", type=float, default=0.2, help="mean response delay in seconds")
+    parser.add_argument("--jitter", type=float, default=0.1, help="standard deviation of the delay")
+    parser.add_argument("--forbidden-rate", type=float, default=0.0, help="fraction of requests answered with 403")
+    parser.add_argument("--lazy-ms", type=int, default=500, help="delay before stories are injected, 0 to inline")
+    parser.add_argument("--source", type=Path, default=DEFAULT_SOURCE, help="archive JSON used to render pages")
+    parser.add_argument("--recordings", type=Path, default=DEFAULT_RECORDINGS, help="directory of recorded HTML")
+    parser.add_argument("--seed", type=int, default=None)
+    return parser
+
+def config_from_args(args: argparse.Namespace) -> FixtureConfig:
+    return FixtureConfig(
+        latency=args.latency,
+        jitter=args.jitter,
+        forbidden_rate=args.forbidden_rate,
+        lazy_ms=args.lazy_ms,
+        source=args.source,
+        recordings=args.recordings,
+        seed=args.seed,
+    )
+
+if __name__ == "__main__":
+    import uvicorn
+    args = build_parser().parse_args()
+    uvicorn.run(create_app(config_from_args(args)), host=args.host, port=args.port, log_level="warning")
@@ -0,0 +1,224 @@
+"""End-to-end scrape and API load test against the local dawn.com fixture.
+
+Starts the fixture server on a free local port, points BASE_URL at it, then
+runs ScraperService.scrape_day over a range of days while concurrently
+hammering the archive API in-process. Reports scrape throughput (days/hour),
+per-section and per-request p50/p99 latency, and browser RSS. Needs no network
+access, only a local Chromium for Playwright.
+
+    cd backend_fastapi
+    python -m loadtest.harness --days 6 --concurrency 2 --forbidden-rate 0.05
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import statistics
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List
+from loadtest.fixture_server import build_parser as fixture_parser, config_from_args, create_app
+
+API_PATHS = [
+    "/api/v1/archive/{date}",
+    "/api/v1/archive/{date}?fields=title,url",
+    "/api/v1/archive/{date}?sections=front-page,national",
+    "/api/v1/archive/{date}/sport",
+]
+
+def percentile(samples: List[float], pct: int) -> float | None:
+    if not samples:
+        return None
+    if len(samples) == 1:
+        return samples[0]
+    return statistics.quantiles(samples, n=100, method="inclusive")[pct - 1]
+
+def summarize(samples: List[float]) -> dict:
+    return {
+        "count": len(samples),
+        "p50_ms": round(percentile(samples, 50) * 1000, 1) if samples else None,
+        "p99_ms": round(percentile(samples, 99) * 1000, 1) if samples else None,
+    }
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def start_fixture(args: argparse.Namespace, port: int):
+    import uvicorn
+    config = uvicorn.Config(create_app(config_from_args(args)), host="127.0.0.1", port=port, log_level="warning")
+    server = uvicorn.Server(config)
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+
+    deadline = time.monotonic() + 10
+    while not server.started:
+        if time.monotonic() > deadline:
+            raise RuntimeError("Fixture server did not start")
+        time.sleep(0.05)
+    return server, thread
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description=__doc__.splitlines()[0],
+        parents=[fixture_parser()],
+        conflict_handler="resolve",
+    )
+    parser.add_argument("--start", default="2013-12-01", help="first day to scrape")
+    parser.add_argument("--days", type=int, default=4, help="number of days to scrape")
+    parser.add_argument("--concurrency", type=int, default=1, help="days scraped at once")
+    parser.add_argument("--api-concurrency", type=int, default=16, help="concurrent API clients")
+    parser.add_argument("--api-requests", type=int, default=2000, help="total API requests")
+    parser.add_argument("--json", type=Path, default=None, help="also write the report here")
+    return parser
+
+async def run(args: argparse.Namespace) -> dict:
+    import httpx
+    from app.main import app
+    from app.models.archive import DayArchive
+    from app.repositories.archive_repo import ArchiveRepository
+    from app.services.browser import BrowserManager
+    from app.services.parser import HTMLParser
+    from app.services.scraper import ScraperService
+    from app.services.watchdog import browser_rss
+
+    start = datetime.strptime(args.start, "%Y-%m-%d")
+    dates = [(start + timedelta(days=i)).strftime("%Y-%m-%d") for i in range(args.days)]
+
+    # The API is driven against days seeded up front, so it has data to serve
+    # while the scrape phase is still running.
+    repository = ArchiveRepository()
+    seed = DayArchive.model_validate_json(Path(args.source).read_text(encoding="utf-8"))
+    api_dates = [(start - timedelta(days=i + 1)).strftime("%Y-%m-%d") for i in range(4)]
+    for date in api_dates:
+        await repository.save(seed.model_copy(update={"date": date}))
+
+    browser = BrowserManager()
+    scraper = ScraperService(browser, HTMLParser(), repository)
+
+    section_latencies: List[float] = []
+    original_scrape_section = scraper.scrape_section
+
+    async def timed_scrape_section(date_string: str, section: str):
+        started = time.perf_counter()
+        try:
+            return await original_scrape_section(date_string, section)
+        finally:
+            section_latencies.append(time.perf_counter() - started)
+
+    scraper.scrape_section = timed_scrape_section
+
+    rss_samples: List[int] = []
+    scraping_done = asyncio.Event()
+
+    async def sample_rss():
+        while not scraping_done.is_set():
+            rss_samples.append(await asyncio.to_thread(browser_rss))
+            await asyncio.sleep(1)
+
+    async def scrape_all() -> float:
+        semaphore = asyncio.Semaphore(args.concurrency)
+
+        async def one(date: str):
+            async with semaphore:
+                await scraper.scrape_day(date)
+
+        started = time.perf_counter()
+        try:
+            await asyncio.gather(*(one(d) for d in dates))
+        finally:
+            scraping_done.set()
+        return time.perf_counter() - started
+
+    api_latencies: List[float] = []
+    api_errors = 0
+
+    async def drive_api() -> float:
+        transport = httpx.ASGITransport(app=app)
+        headers = {"x-api-key": os.environ["TAIMOUR_API_KEY"]}
+        counter = iter(range(args.api_requests))
+
+        async with httpx.AsyncClient(transport=transport, base_url="http://api", headers=headers) as client:
+            async def worker():
+                nonlocal api_errors
+                for n in counter:
+                    path = API_PATHS[n % len(API_PATHS)].format(date=api_dates[n % len(api_dates)])
+                    started = time.perf_counter()
+                    response = await client.get(path)
+                    api_latencies.append(time.perf_counter() - started)
+                    if response.status_code != 200:
+                        api_errors += 1
+
+            started = time.perf_counter()
+            await asyncio.gather(*(worker() for _ in range(args.api_concurrency)))
+            return time.perf_counter() - started
+
+    sampler = asyncio.create_task(sample_rss())
+    try:
+        scrape_seconds, api_seconds = await asyncio.gather(scrape_all(), drive_api())
+    finally:
+        await sampler
+        await browser.close()
+
+    scraped = [await repository.load(d) for d in dates]
+    articles = sum(sum(len(a) for a in day.sections.values()) for day in scraped if day)
+
+    return {
+        "fixture": {
+            "latency_s": args.latency,
+            "forbidden_rate": args.forbidden_rate,
+            "lazy_ms": args.lazy_ms,
+        },
+        "scrape": {
+            "days": len(dates),
+            "concurrency": args.concurrency,
+            "seconds": round(scrape_seconds, 1),
+            "days_per_hour": round(len(dates) / scrape_seconds * 3600, 1),
+            "articles": articles,
+            "section_latency": summarize(section_latencies),
+            "rate_limits": scraper.rate_limiter.stats(),
+            "browser": browser.health(),
+        },
+        "api": {
+            "requests": len(api_latencies),
+            "errors": api_errors,
+            "requests_per_second": round(len(api_latencies) / api_seconds, 1),
+            "latency": summarize(api_latencies),
+        },
+        "browser_rss_mb": {
+            "peak": round(max(rss_samples, default=0) / (1024 * 1024), 1),
+            "mean": round(statistics.fmean(rss_samples) / (1024 * 1024), 1) if rss_samples else None,
+        },
+    }
+
+def main() -> None:
+    args = build_parser().parse_args()
+    port = free_port()
+    base_url = f"http://127.0.0.1:{port}/newspaper"
+    data_dir = Path(tempfile.mkdtemp(prefix="dawn-loadtest-"))
+
+    # Settings are read at import time, so configure before importing the app.
+    os.environ["BASE_URL"] = base_url
+    os.environ["DATA_DIR"] = str(data_dir)
+    os.environ.setdefault("TAIMOUR_API_KEY", "loadtest")
+    os.environ.pop("PROXY_URL", None)
+    os.environ.pop("PROXY_URLS", None)
+
+    server, thread = start_fixture(args, port)
+    try:
+        report = asyncio.run(run(args))
+    finally:
+        server.should_exit = True
+        thread.join(timeout=5)
+
+    print(json.dumps(report, indent=2))
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2))
+
+if __name__ == "__main__":
+    main()